@@ -0,0 +1,85 @@
+"""Add supplier change feed
+
+Revision ID: 0b7e5f3c1a98
+Revises: f3a8c61d2b74
+Create Date: 2026-10-17 19:12:07.844105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7e5f3c1a98'
+down_revision: Union[str, None] = 'f3a8c61d2b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('supplier_change_seq')))
+    op.add_column('suppliers', sa.Column('change_seq', sa.BigInteger(), nullable=True))
+    # Existing rows enter the feed in an arbitrary but fixed order
+    op.execute("UPDATE suppliers SET change_seq = nextval('supplier_change_seq')")
+    op.create_index(
+        op.f('ix_suppliers_change_seq'), 'suppliers', ['change_seq'], unique=False
+    )
+    op.create_table(
+        'supplier_tombstones',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column(
+            'deleted_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_supplier_tombstones_change_seq'),
+        'supplier_tombstones',
+        ['change_seq'],
+        unique=False,
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION supplier_track_change() RETURNS trigger AS $$
+        BEGIN
+            -- Serialize supplier writers so change_seq values commit in order
+            -- and a reader never skips past a change that is still in flight
+            PERFORM pg_advisory_xact_lock(hashtext('supplier_change_seq'));
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO supplier_tombstones (id, change_seq)
+                VALUES (OLD.id, nextval('supplier_change_seq'))
+                ON CONFLICT (id) DO UPDATE SET change_seq = EXCLUDED.change_seq;
+                RETURN OLD;
+            END IF;
+            NEW.change_seq := nextval('supplier_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER suppliers_track_change
+        BEFORE INSERT OR UPDATE OR DELETE ON suppliers
+        FOR EACH ROW EXECUTE FUNCTION supplier_track_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER suppliers_track_change ON suppliers')
+    op.execute('DROP FUNCTION supplier_track_change()')
+    op.drop_index(
+        op.f('ix_supplier_tombstones_change_seq'), table_name='supplier_tombstones'
+    )
+    op.drop_table('supplier_tombstones')
+    op.drop_index(op.f('ix_suppliers_change_seq'), table_name='suppliers')
+    op.drop_column('suppliers', 'change_seq')
+    op.execute(sa.schema.DropSequence(sa.Sequence('supplier_change_seq')))
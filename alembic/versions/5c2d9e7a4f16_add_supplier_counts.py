@@ -0,0 +1,133 @@
+"""Add supplier counters for the stats endpoint
+
+Revision ID: 5c2d9e7a4f16
+Revises: 0b7e5f3c1a98
+Create Date: 2026-10-17 20:31:52.610482
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2d9e7a4f16'
+down_revision: Union[str, None] = '0b7e5f3c1a98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing suppliers keep a NULL created_at; new ones get now()
+    op.add_column(
+        'suppliers', sa.Column('created_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.alter_column('suppliers', 'created_at', server_default=sa.text('now()'))
+    op.create_index(
+        op.f('ix_suppliers_created_at'), 'suppliers', ['created_at'], unique=False
+    )
+    op.create_table(
+        'supplier_counts',
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('supplier_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('bucket'),
+    )
+    # Writes between the backfill and the triggers would never be counted;
+    # block them until the migration commits. Reads carry on
+    op.execute('LOCK TABLE suppliers IN SHARE ROW EXCLUSIVE MODE')
+    op.execute(
+        """
+        INSERT INTO supplier_counts (bucket, supplier_count)
+        SELECT '*', count(*) FROM suppliers
+        UNION ALL
+        SELECT 'domain:' || lower(split_part(email, '@', 2)), count(*)
+        FROM suppliers WHERE email IS NOT NULL
+        GROUP BY 1
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION supplier_update_counts() RETURNS trigger AS $$
+        BEGIN
+            -- Each branch only reads the transition tables its event provides
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO supplier_counts (bucket, supplier_count)
+                SELECT bucket, sum(delta) FROM (
+                    SELECT '*' AS bucket, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT 'day:' || to_char(now() AT TIME ZONE 'UTC', 'YYYY-MM-DD'), 1
+                    FROM new_rows
+                    UNION ALL
+                    SELECT 'domain:' || lower(split_part(email, '@', 2)), 1
+                    FROM new_rows WHERE email IS NOT NULL
+                ) AS deltas
+                GROUP BY bucket
+                ON CONFLICT (bucket) DO UPDATE
+                SET supplier_count = supplier_counts.supplier_count
+                    + EXCLUDED.supplier_count;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO supplier_counts (bucket, supplier_count)
+                SELECT bucket, sum(delta) FROM (
+                    SELECT '*' AS bucket, -1 AS delta FROM old_rows
+                    UNION ALL
+                    SELECT 'domain:' || lower(split_part(email, '@', 2)), -1
+                    FROM old_rows WHERE email IS NOT NULL
+                ) AS deltas
+                GROUP BY bucket
+                ON CONFLICT (bucket) DO UPDATE
+                SET supplier_count = supplier_counts.supplier_count
+                    + EXCLUDED.supplier_count;
+            ELSE
+                -- Only email changes move counts; other updates net to zero
+                INSERT INTO supplier_counts (bucket, supplier_count)
+                SELECT bucket, sum(delta) FROM (
+                    SELECT 'domain:' || lower(split_part(email, '@', 2)) AS bucket,
+                        -1 AS delta
+                    FROM old_rows WHERE email IS NOT NULL
+                    UNION ALL
+                    SELECT 'domain:' || lower(split_part(email, '@', 2)), 1
+                    FROM new_rows WHERE email IS NOT NULL
+                ) AS deltas
+                GROUP BY bucket
+                HAVING sum(delta) <> 0
+                ON CONFLICT (bucket) DO UPDATE
+                SET supplier_count = supplier_counts.supplier_count
+                    + EXCLUDED.supplier_count;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER suppliers_count_insert AFTER INSERT ON suppliers
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER suppliers_count_update AFTER UPDATE ON suppliers
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER suppliers_count_delete AFTER DELETE ON suppliers
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER suppliers_count_delete ON suppliers')
+    op.execute('DROP TRIGGER suppliers_count_update ON suppliers')
+    op.execute('DROP TRIGGER suppliers_count_insert ON suppliers')
+    op.execute('DROP FUNCTION supplier_update_counts()')
+    op.drop_table('supplier_counts')
+    op.drop_index(op.f('ix_suppliers_created_at'), table_name='suppliers')
+    op.drop_column('suppliers', 'created_at')
@@ -0,0 +1,38 @@
+"""Add pg_trgm GIN indexes for supplier search
+
+Revision ID: 8d9a05156907
+Revises: bd5f20e322c3
+Create Date: 2026-10-17 10:04:27.118604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d9a05156907'
+down_revision: Union[str, None] = 'bd5f20e322c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('name', 'email', 'phone', 'address')
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_suppliers_{column}_trgm',
+            'suppliers',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f'ix_suppliers_{column}_trgm', table_name='suppliers')
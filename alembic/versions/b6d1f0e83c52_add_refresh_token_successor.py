@@ -0,0 +1,33 @@
+"""Add refresh token successor
+
+Revision ID: b6d1f0e83c52
+Revises: 5c2d9e7a4f16
+Create Date: 2026-10-17 20:12:08.304518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d1f0e83c52'
+down_revision: Union[str, None] = '5c2d9e7a4f16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('rotated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        'refresh_tokens', sa.Column('successor', sa.LargeBinary(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('refresh_tokens', 'successor')
+    op.drop_column('refresh_tokens', 'rotated_at')
@@ -0,0 +1,26 @@
+"""Add composite (name, id) index for supplier keyset pagination
+
+Revision ID: bd5f20e322c3
+Revises: a638ea2f2451
+Create Date: 2026-10-17 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bd5f20e322c3'
+down_revision: Union[str, None] = 'a638ea2f2451'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_suppliers_name_id', 'suppliers', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_suppliers_name_id', table_name='suppliers')
@@ -0,0 +1,31 @@
+"""Enforce unique supplier email and phone
+
+Revision ID: c2c5cf708b7f
+Revises: 8d9a05156907
+Create Date: 2026-10-17 11:21:09.734452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2c5cf708b7f'
+down_revision: Union[str, None] = '8d9a05156907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if duplicate emails/phones already exist; resolve those first
+    op.drop_index(op.f('ix_suppliers_email'), table_name='suppliers')
+    op.create_index(op.f('ix_suppliers_email'), 'suppliers', ['email'], unique=True)
+    op.create_index(op.f('ix_suppliers_phone'), 'suppliers', ['phone'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_suppliers_phone'), table_name='suppliers')
+    op.drop_index(op.f('ix_suppliers_email'), table_name='suppliers')
+    op.create_index(op.f('ix_suppliers_email'), 'suppliers', ['email'], unique=False)
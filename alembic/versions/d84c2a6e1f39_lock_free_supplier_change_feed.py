@@ -0,0 +1,117 @@
+"""Track supplier changes without a lock between writers
+
+Revision ID: d84c2a6e1f39
+Revises: b6d1f0e83c52
+Create Date: 2026-10-17 21:04:36.519827
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd84c2a6e1f39'
+down_revision: Union[str, None] = 'b6d1f0e83c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing changes have all committed; they sort before any new one at 0
+    op.add_column(
+        'suppliers', sa.Column('change_txid', sa.BigInteger(), nullable=True)
+    )
+    op.execute('UPDATE suppliers SET change_txid = 0')
+    op.add_column(
+        'supplier_tombstones',
+        sa.Column(
+            'change_txid', sa.BigInteger(), server_default='0', nullable=False
+        ),
+    )
+    op.drop_index(op.f('ix_suppliers_change_seq'), table_name='suppliers')
+    op.create_index(
+        'ix_suppliers_change_position',
+        'suppliers',
+        ['change_txid', 'change_seq'],
+        unique=False,
+    )
+    op.drop_index(
+        op.f('ix_supplier_tombstones_change_seq'), table_name='supplier_tombstones'
+    )
+    op.create_index(
+        'ix_supplier_tombstones_change_position',
+        'supplier_tombstones',
+        ['change_txid', 'change_seq'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_supplier_tombstones_deleted_at'),
+        'supplier_tombstones',
+        ['deleted_at'],
+        unique=False,
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION supplier_track_change() RETURNS trigger AS $$
+        BEGIN
+            -- No lock between writers: the feed only returns changes of
+            -- transactions older than the reader's snapshot xmin, which have
+            -- all finished, so a change can never commit behind a token
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO supplier_tombstones (id, change_txid, change_seq)
+                VALUES (OLD.id, txid_current(), nextval('supplier_change_seq'))
+                ON CONFLICT (id) DO UPDATE
+                SET change_txid = EXCLUDED.change_txid,
+                    change_seq = EXCLUDED.change_seq,
+                    deleted_at = now();
+                RETURN OLD;
+            END IF;
+            NEW.change_txid := txid_current();
+            NEW.change_seq := nextval('supplier_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION supplier_track_change() RETURNS trigger AS $$
+        BEGIN
+            -- Serialize supplier writers so change_seq values commit in order
+            -- and a reader never skips past a change that is still in flight
+            PERFORM pg_advisory_xact_lock(hashtext('supplier_change_seq'));
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO supplier_tombstones (id, change_seq)
+                VALUES (OLD.id, nextval('supplier_change_seq'))
+                ON CONFLICT (id) DO UPDATE SET change_seq = EXCLUDED.change_seq;
+                RETURN OLD;
+            END IF;
+            NEW.change_seq := nextval('supplier_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.drop_index(
+        op.f('ix_supplier_tombstones_deleted_at'), table_name='supplier_tombstones'
+    )
+    op.drop_index(
+        'ix_supplier_tombstones_change_position', table_name='supplier_tombstones'
+    )
+    op.create_index(
+        op.f('ix_supplier_tombstones_change_seq'),
+        'supplier_tombstones',
+        ['change_seq'],
+        unique=False,
+    )
+    op.drop_index('ix_suppliers_change_position', table_name='suppliers')
+    op.create_index(
+        op.f('ix_suppliers_change_seq'), 'suppliers', ['change_seq'], unique=False
+    )
+    op.drop_column('supplier_tombstones', 'change_txid')
+    op.drop_column('suppliers', 'change_txid')
@@ -0,0 +1,29 @@
+"""Add supplier row version
+
+Revision ID: e41b7d0c9a25
+Revises: c2c5cf708b7f
+Create Date: 2026-10-17 16:42:18.102934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7d0c9a25'
+down_revision: Union[str, None] = 'c2c5cf708b7f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'suppliers',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('suppliers', 'version')
@@ -1,21 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import settings_config
 from app.core import security
-from app.db.database import get_db
+from app.core.responses import FastJSONRoute
+from app.db.database import get_async_db
 from app.exceptions.database import DatabaseOperationException
+from app.exceptions.security import InvalidRefreshTokenException
 from app.exceptions.user import UserAlreadyExistsException, UserNotFoundException
 from app.schemas.user import Token, User, UserCreate, UserLogin, UserLogoutResponse
-from app.services.user_service import UserService
+from app.services.refresh_token_service import AsyncRefreshTokenService
+from app.services.user_service import AsyncUserService
 
-routes = APIRouter()
+routes = APIRouter(route_class=FastJSONRoute)
+
+# The refresh token cookie is only sent to the auth endpoints
+REFRESH_TOKEN_COOKIE_PATH = "/api/auth"
+
+
+def set_auth_cookies(response: Response, email: str, refresh_token: str) -> None:
+    """
+    Set the access and refresh token cookies for a user
+
+    Args:
+        response (Response): The response to set the cookies on
+        email (str): The user's email, the access token subject
+        refresh_token (str): The refresh token issued for this login
+    """
+    access_token = security.create_access_token(
+        data={"sub": email},
+        expires_delta=settings_config.ACCESS_TOKEN_EXPIRE_MINUTES,
+    )
+
+    # Set the access token in a secure HTTP-only cookie
+    response.set_cookie(
+        key="access_token",
+        value=f"Bearer {access_token}",
+        httponly=True,
+        secure=True,
+        samesite="none",
+        max_age=settings_config.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        domain="react-backend-cio3.onrender.com",
+        path="/",  # This ensures that cookie is sent with all requests
+    )
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=True,
+        samesite="none",
+        max_age=settings_config.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+        domain="react-backend-cio3.onrender.com",
+        path=REFRESH_TOKEN_COOKIE_PATH,
+    )
 
 
 @routes.post("/login", response_model=Token)
 async def login(
-    response: Response, form_data: UserLogin, db: Session = Depends(get_db)
+    response: Response,
+    form_data: UserLogin,
+    db: AsyncSession = Depends(get_async_db),
 ):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -23,34 +68,40 @@ async def login(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        user = UserService.authenticate_user(
+        user = await AsyncUserService.authenticate_user(
             db=db, email=form_data.email, password=form_data.password
         )
-        access_token = security.create_access_token(
-            data={"sub": user.email},
-            expires_delta=settings_config.ACCESS_TOKEN_EXPIRE_MINUTES,
-        )
-
-        # Set the access token in a secure HTTP-only cookie
-        response.set_cookie(
-            key="access_token",
-            value=f"Bearer {access_token}",
-            httponly=True,
-            secure=True,
-            samesite="none",
-            max_age=settings_config.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-            domain="react-backend-cio3.onrender.com",
-            path="/",  # This ensures that cookie is sent with all requests
-        )
+        refresh_token = await AsyncRefreshTokenService.issue(db=db, user_id=user.id)
+        set_auth_cookies(response, user.email, refresh_token)
         return {"message": "User logged in successfully!", "user": user}
     except (UserNotFoundException, ValueError):
         raise credentials_exception
+    except DatabaseOperationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@routes.post("/refresh", response_model=Token)
+async def refresh(
+    response: Response,
+    refresh_token: str = Cookie(None, alias="refresh_token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if not refresh_token:
+        raise InvalidRefreshTokenException()
+    try:
+        user, new_refresh_token = await AsyncRefreshTokenService.rotate(
+            db=db, token=refresh_token
+        )
+    except DatabaseOperationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    set_auth_cookies(response, user.email, new_refresh_token)
+    return {"message": "Session refreshed successfully!", "user": user}
 
 
 @routes.post("/signup", response_model=User)
-async def signup(user: UserCreate, db: Session = Depends(get_db)):
+async def signup(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     try:
-        new_user = UserService.create_user(db=db, user=user)
+        new_user = await AsyncUserService.create_user(db=db, user=user)
         return new_user
     except UserAlreadyExistsException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -61,6 +112,20 @@ async def signup(user: UserCreate, db: Session = Depends(get_db)):
 
 
 @routes.post("/logout", response_model=UserLogoutResponse)
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    refresh_token: str = Cookie(None, alias="refresh_token"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if refresh_token:
+        try:
+            await AsyncRefreshTokenService.revoke(db=db, token=refresh_token)
+        except DatabaseOperationException as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
     response.delete_cookie(key="access_token", domain="localhost", path="/")
+    response.delete_cookie(
+        key="refresh_token",
+        domain="react-backend-cio3.onrender.com",
+        path=REFRESH_TOKEN_COOKIE_PATH,
+    )
     return {"message": "User logged out successfully!"}
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from app.core.auth import require_admin
+from app.core.cpu_profiler import cpu_profiler
+from app.core.responses import FastJSONRoute
+from app.schemas.profiler import CPUProfilerStatus, CPUProfileSession, CPUProfileStart
+from app.schemas.user import User
+
+routes = APIRouter(route_class=FastJSONRoute)
+
+
+@routes.get("/cpu", response_model=CPUProfilerStatus)
+async def get_cpu_profiler(current_user: User = Depends(require_admin)):
+    return {"session": cpu_profiler.status(), "profiles": cpu_profiler.profiles()}
+
+
+@routes.post("/cpu", response_model=CPUProfileSession, status_code=202)
+async def start_cpu_profile(
+    options: CPUProfileStart, current_user: User = Depends(require_admin)
+):
+    return cpu_profiler.start(options.seconds, sample_rate=options.sample_rate)
+
+
+@routes.post("/cpu/stop", response_model=CPUProfileSession)
+def stop_cpu_profile(current_user: User = Depends(require_admin)):
+    # Sync so the wait for the sampler thread to write its output runs in
+    # the threadpool rather than on the event loop
+    return cpu_profiler.stop()
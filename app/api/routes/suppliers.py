@@ -1,52 +1,431 @@
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Cookie,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import require_auth
-from app.db.database import get_db
+from app.config.settings import settings_config
+from app.core.auth import authenticate_access_token, require_auth
+from app.core.bulk_export import (
+    EXPORT_MEDIA_TYPES,
+    gzip_chunks,
+    iter_csv_chunks,
+    iter_ndjson_chunks,
+)
+from app.core.bulk_import import SUPPORTED_FORMATS, detect_format, iter_records
+from app.core.etag import collection_etag, match_versions, none_match, version_etag
+from app.core.events import supplier_events
+from app.core.response_cache import supplier_cache
+from app.core.responses import FastJSONRoute, dump_json
+from app.core.single_flight import supplier_flight
+from app.db.database import AsyncSessionLocal, get_async_db
 from app.exceptions.database import DatabaseOperationException
 from app.exceptions.supplier import (
+    InvalidSupplierChangeTokenException,
+    InvalidSupplierCursorException,
     SupplierAlreadyExistsException,
+    SupplierBatchTooLargeException,
+    SupplierChangeTokenExpiredException,
     SupplierNotFoundException,
+    SupplierVersionMismatchException,
 )
 from app.schemas import supplier as supplier_schema
 from app.schemas.user import User
-from app.services.supplier_service import SupplierService
+from app.services.supplier_service import AsyncSupplierService
+
+routes = APIRouter(route_class=FastJSONRoute)
+
+# A day short of the tombstone retention, so a token that passes never
+# follows a tombstone pruned while a transaction spanned the boundary
+CHANGE_TOKEN_LIFETIME = timedelta(
+    days=settings_config.SUPPLIER_TOMBSTONE_RETENTION_DAYS - 1
+)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def json_response(etag: str, content: bytes | None) -> Response:
+    # No content means If-None-Match matched and the body was never serialized
+    if content is None:
+        return not_modified(etag)
+    return Response(
+        content=content, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+class RenderedJSON:
+    """
+    A response whose ETag is known from the rows and whose body is only
+    serialized once a caller actually needs it
+    """
+
+    def __init__(self, etag: str, serialize: Callable[[], bytes]):
+        self.etag = etag
+        self.serialize = serialize
+        self.content: bytes | None = None
+
+
+async def render_suppliers(
+    db: AsyncSession, skip: int, limit: int, cursor: Optional[str]
+) -> RenderedJSON:
+    # Passing `cursor` (empty for the first page) switches to keyset pagination
+    if cursor is not None:
+        page = await AsyncSupplierService.get_suppliers_page(db, cursor, limit)
+        etag = collection_etag(
+            ((supplier.id, supplier.version) for supplier in page.items),
+            page.next_cursor,
+        )
+        return RenderedJSON(etag, lambda: page.model_dump_json().encode())
+
+    suppliers = await AsyncSupplierService.get_suppliers(db, skip, limit)
+    etag = collection_etag(
+        ((supplier.id, supplier.version) for supplier in suppliers), None
+    )
+    return RenderedJSON(
+        etag, lambda: dump_json(list[supplier_schema.Supplier], suppliers)
+    )
+
+
+async def render_supplier(db: AsyncSession, supplier_id: UUID) -> RenderedJSON:
+    supplier = await AsyncSupplierService.get_supplier(db, supplier_id)
+    return RenderedJSON(
+        version_etag(supplier.version),
+        lambda: dump_json(supplier_schema.Supplier, supplier),
+    )
+
+
+async def load_json(
+    key: str,
+    render: Callable[..., Awaitable[RenderedJSON]],
+    db: AsyncSession,
+    if_none_match: str | None,
+    *args,
+) -> tuple[str, bytes | None]:
+    """
+    Get a rendered supplier response from the cache, a concurrent identical
+    request, or the database, in that order
+
+    The ETag is worked out from the rows' (id, version) before anything is
+    serialized, so a request whose If-None-Match matches gets its 304 without
+    paying for the body.
+
+    Args:
+        key (str): Normalized description of the read, e.g. "list:0:100"
+        render (Callable): Queries the rows given a session
+        db (AsyncSession): The request's session, closed before a shared
+            load so the request never holds two connections
+        if_none_match (str | None): The request's If-None-Match header
+        *args: Passed to render after the session
+
+    Returns:
+        tuple[str, bytes | None]: The ETag and JSON body, or no body when the
+            client's copy is current
+    """
+    # Clients pinned to the primary after a write read through on their own
+    if db.info.get("primary_only"):
+        rendered = await render(db, *args)
+        if none_match(if_none_match, rendered.etag):
+            return rendered.etag, None
+        return rendered.etag, rendered.serialize()
+
+    generation = await supplier_cache.generation()
+    cached = await supplier_cache.get(key, generation)
+    if cached is not None:
+        etag, content = cached
+        return etag, None if none_match(if_none_match, etag) else content
+
+    async def load() -> RenderedJSON:
+        # The shared load outlives any single caller, so it uses its own session
+        async with AsyncSessionLocal() as flight_db:
+            if supplier_cache.changed_within(
+                settings_config.REPLICA_STICKINESS_SECONDS
+            ):
+                # A lagging replica would put the pre-write rows back in the
+                # cache for the whole TTL, so refill from the primary until
+                # replicas have caught up with the write that invalidated it
+                flight_db.info["primary_only"] = True
+            return await render(flight_db, *args)
 
-routes = APIRouter()
+    # The request's session can still hold the connection its user lookup
+    # checked out; hand it back so a fill holds one pooled connection, not two
+    await db.close()
+    rendered = await supplier_flight.do(f"{generation}:{key}", load)
+    if none_match(if_none_match, rendered.etag):
+        return rendered.etag, None
+    if rendered.content is None:
+        # The first caller that needs the body serializes and caches it for
+        # the others sharing this load
+        rendered.content = rendered.serialize()
+        await supplier_cache.set(key, generation, rendered.etag, rendered.content)
+    return rendered.etag, rendered.content
 
 
-@routes.get("/", response_model=list[supplier_schema.Supplier])
+@routes.get(
+    "/",
+    response_model=list[supplier_schema.Supplier] | supplier_schema.SupplierPage,
+)
 async def get_suppliers(
     current_user: User = Depends(require_auth),
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings_config.SUPPLIER_PAGE_MAX_SIZE),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    key = f"page:{cursor}:{limit}" if cursor is not None else f"list:{skip}:{limit}"
+    try:
+        etag, content = await load_json(
+            key, render_suppliers, db, if_none_match, skip, limit, cursor
+        )
+    except InvalidSupplierCursorException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    return json_response(etag, content)
+
+
+@routes.get("/search", response_model=list[supplier_schema.Supplier])
+async def search_suppliers(
+    q: str = Query(min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings_config.SUPPLIER_PAGE_MAX_SIZE),
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncSupplierService.search_suppliers(db, q, skip, limit)
+
+
+@routes.get("/changes", response_model=supplier_schema.SupplierChanges)
+async def get_supplier_changes(
+    since: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=settings_config.SUPPLIER_BATCH_MAX_SIZE),
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return SupplierService.get_suppliers(db, skip, limit)
+    try:
+        return await AsyncSupplierService.get_supplier_changes(
+            db, since, limit, token_lifetime=CHANGE_TOKEN_LIFETIME
+        )
+    except (
+        InvalidSupplierChangeTokenException,
+        SupplierChangeTokenExpiredException,
+    ) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@routes.get("/stats", response_model=supplier_schema.SupplierStats)
+async def get_supplier_stats(
+    top_domains: int = Query(10, ge=1, le=100),
+    days: int = Query(7, ge=1, le=90),
+    recent: int = Query(10, ge=0, le=100),
+    approximate: bool = False,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncSupplierService.get_supplier_stats(
+        db, top_domains=top_domains, days=days, recent=recent, approximate=approximate
+    )
+
+
+@routes.websocket("/ws")
+async def supplier_updates(
+    websocket: WebSocket, access_token: str = Cookie(None, alias="access_token")
+):
+    # CORS does not cover WebSocket handshakes: without this any page the
+    # user visits could open the socket with their cookie
+    if websocket.headers.get("origin") not in settings_config.ALLOWED_ORIGINS:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    # A short-lived session: the socket must not hold a pooled connection
+    try:
+        async with AsyncSessionLocal() as db:
+            await authenticate_access_token(access_token, db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = await supplier_events.subscribe()
+
+    async def send() -> None:
+        async for message in subscription:
+            await websocket.send_text(message)
+
+    async def receive() -> None:
+        # Clients send nothing; reading is how a disconnect is noticed
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    sender = asyncio.create_task(send())
+    receiver = asyncio.create_task(receive())
+    try:
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        supplier_events.unsubscribe(subscription)
+        sender.cancel()
+        receiver.cancel()
+    if sender.done() and not sender.cancelled() and sender.exception() is None:
+        # Evicted as a slow consumer (or shutting down): ask it to reconnect
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+
+@routes.get("/export")
+async def export_suppliers(
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    current_user: User = Depends(require_auth),
+):
+    async def body():
+        # The request-scoped session is closed before the response streams,
+        # so the export holds its own session for the lifetime of the body
+        async with AsyncSessionLocal() as db:
+            batches = AsyncSupplierService.stream_suppliers(
+                db, batch_size=settings_config.SUPPLIER_EXPORT_BATCH_SIZE
+            )
+            render = iter_csv_chunks if format == "csv" else iter_ndjson_chunks
+            chunks = render(AsyncSupplierService.EXPORT_COLUMNS, batches)
+            if gzip:
+                chunks = gzip_chunks(chunks)
+            async for chunk in chunks:
+                yield chunk
+
+    headers = {"Content-Disposition": f'attachment; filename="suppliers.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        body(), media_type=EXPORT_MEDIA_TYPES[format], headers=headers
+    )
+
+
+@routes.post("/batch-get", response_model=supplier_schema.SupplierBatchGetResult)
+async def batch_get_suppliers(
+    batch: supplier_schema.SupplierBatchGetRequest,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    supplier_ids = list(dict.fromkeys(batch.ids))
+    if len(supplier_ids) > settings_config.SUPPLIER_BATCH_MAX_SIZE:
+        raise SupplierBatchTooLargeException(
+            len(supplier_ids), settings_config.SUPPLIER_BATCH_MAX_SIZE
+        )
+
+    suppliers = await AsyncSupplierService.get_suppliers_by_ids(db, supplier_ids)
+    found = {supplier.id for supplier in suppliers}
+    return {
+        "items": suppliers,
+        "missing": [
+            supplier_id for supplier_id in supplier_ids if supplier_id not in found
+        ],
+    }
+
+
+@routes.post("/bulk-update", response_model=supplier_schema.SupplierBulkResult)
+async def bulk_update_suppliers(
+    batch: supplier_schema.SupplierBulkUpdateRequest,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if len(batch.items) > settings_config.SUPPLIER_BATCH_MAX_SIZE:
+        raise SupplierBatchTooLargeException(
+            len(batch.items), settings_config.SUPPLIER_BATCH_MAX_SIZE
+        )
+    try:
+        return await AsyncSupplierService.bulk_update_suppliers(
+            db=db,
+            items=batch.items,
+            chunk_size=settings_config.SUPPLIER_BULK_CHUNK_SIZE,
+        )
+    except DatabaseOperationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@routes.post("/bulk-delete", response_model=supplier_schema.SupplierBulkResult)
+async def bulk_delete_suppliers(
+    batch: supplier_schema.SupplierBulkDeleteRequest,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if len(batch.ids) > settings_config.SUPPLIER_BATCH_MAX_SIZE:
+        raise SupplierBatchTooLargeException(
+            len(batch.ids), settings_config.SUPPLIER_BATCH_MAX_SIZE
+        )
+    try:
+        return await AsyncSupplierService.bulk_delete_suppliers(
+            db=db,
+            supplier_ids=batch.ids,
+            chunk_size=settings_config.SUPPLIER_BULK_CHUNK_SIZE,
+        )
+    except DatabaseOperationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@routes.post("/import", response_model=supplier_schema.SupplierImportResult)
+async def import_suppliers(
+    request: Request,
+    format: Optional[str] = None,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db),
+):
+    import_format = format or detect_format(request.headers.get("content-type"))
+    if import_format not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson",
+        )
+    try:
+        return await AsyncSupplierService.import_suppliers(
+            db=db,
+            records=iter_records(request.stream(), import_format),
+            chunk_size=settings_config.SUPPLIER_IMPORT_CHUNK_SIZE,
+        )
+    except DatabaseOperationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
 
 @routes.get("/{supplier_id}", response_model=supplier_schema.Supplier)
 async def get_supplier(
     supplier_id: UUID,
     current_user: User = Depends(require_auth),
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        return SupplierService.get_supplier(db, supplier_id)
+        etag, content = await load_json(
+            f"item:{supplier_id}", render_supplier, db, if_none_match, supplier_id
+        )
     except SupplierNotFoundException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
+    return json_response(etag, content)
 
 
 @routes.post("/", response_model=supplier_schema.Supplier)
 async def create_supplier(
     supplier: supplier_schema.SupplierCreate,
+    response: Response,
     current_user: User = Depends(require_auth),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        return SupplierService.create_supplier(db=db, supplier=supplier)
+        new_supplier = await AsyncSupplierService.create_supplier(
+            db=db, supplier=supplier
+        )
+        response.headers["ETag"] = version_etag(new_supplier.version)
+        return new_supplier
     except SupplierAlreadyExistsException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except DatabaseOperationException as e:
@@ -57,15 +436,24 @@ async def create_supplier(
 async def update_supplier(
     supplier_id: UUID,
     supplier: supplier_schema.SupplierUpdate,
+    response: Response,
     current_user: User = Depends(require_auth),
-    db: Session = Depends(get_db),
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        return SupplierService.update_supplier(
-            db=db, supplier_id=supplier_id, supplier=supplier
+        updated_supplier = await AsyncSupplierService.update_supplier(
+            db=db,
+            supplier_id=supplier_id,
+            supplier=supplier,
+            expected_versions=match_versions(if_match),
         )
+        response.headers["ETag"] = version_etag(updated_supplier.version)
+        return updated_supplier
     except SupplierNotFoundException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except SupplierVersionMismatchException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except DatabaseOperationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
 
@@ -74,11 +462,16 @@ async def update_supplier(
 async def delete_supplier(
     supplier_id: UUID,
     current_user: User = Depends(require_auth),
-    db: Session = Depends(get_db),
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        SupplierService.delete_supplier(db=db, supplier_id=supplier_id)
+        await AsyncSupplierService.delete_supplier(
+            db=db, supplier_id=supplier_id, expected_versions=match_versions(if_match)
+        )
     except SupplierNotFoundException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except SupplierVersionMismatchException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except DatabaseOperationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_auth
-from app.db.database import get_db
+from app.core.responses import FastJSONRoute
+from app.db.database import get_async_db
 from app.exceptions.database import DatabaseOperationException
 from app.exceptions.user import UserNotFoundException
 from app.schemas.user import User, UserUpdate
-from app.services.user_service import UserService
+from app.services.user_service import AsyncUserService
 
-routes = APIRouter()
+routes = APIRouter(route_class=FastJSONRoute)
 
 
 @routes.get("/me", response_model=User)
@@ -20,10 +21,10 @@ async def get_user(current_user: User = Depends(require_auth)):
 async def update_user(
     new_data: UserUpdate,
     current_user: User = Depends(require_auth),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        updated_user = UserService.update_user(
+        updated_user = await AsyncUserService.update_user(
             db=db, user_id=current_user.id, user=new_data
         )
         return updated_user
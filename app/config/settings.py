@@ -1,14 +1,69 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_SECONDS: float = 30.0
+    REPLICA_STICKINESS_SECONDS: int = 5
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10
     DOMAIN: str
     ENVIRONMENT: str
     FRONTEND_URL: str
+    ADMIN_EMAILS: str = ""
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: int = 60
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    SUPPLIER_IMPORT_CHUNK_SIZE: int = 1000
+    SUPPLIER_EXPORT_BATCH_SIZE: int = 1000
+    SUPPLIER_BATCH_MAX_SIZE: int = 5000
+    SUPPLIER_PAGE_MAX_SIZE: int = 1000
+    SUPPLIER_BULK_CHUNK_SIZE: int = 500
+    SUPPLIER_CACHE_MAX_SIZE: int = 512
+    SUPPLIER_CACHE_TTL_SECONDS: float = 5.0
+    SUPPLIER_CACHE_BACKEND: str = ""
+    SUPPLIER_EVENTS_QUEUE_SIZE: int = 256
+    SUPPLIER_EVENTS_BACKEND: str = ""
+    # Change tokens live a day less than tombstones, so at least two days
+    SUPPLIER_TOMBSTONE_RETENTION_DAYS: int = Field(30, ge=2)
+    SUPPLIER_TOMBSTONE_PRUNE_INTERVAL_SECONDS: float = 3600.0
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
+    SQL_PROFILING_ENABLED: bool = False
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_PROFILE_TOP_STATEMENTS: int = 3
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 10
+    CPU_PROFILING_ENABLED: bool = False
+    CPU_PROFILE_INTERVAL_MS: float = 10.0
+    CPU_PROFILE_MAX_SECONDS: float = 300.0
+    CPU_PROFILE_OUTPUT_DIR: str = "cpu-profiles"
+    CPU_PROFILE_MAX_FILES: int = 20
+    FAST_JSON_RESPONSES: bool = True
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_CONTENT_TYPES: str = (
+        "application/json,application/x-ndjson,text/csv,text/plain"
+    )
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 2.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+
+    @property
+    def ALLOWED_ORIGINS(self) -> list[str]:
+        # Used for CORS and to check the Origin of WebSocket handshakes,
+        # which CORS does not cover
+        return [self.FRONTEND_URL, "http://localhost:3000"]
 
     class Config:
         env_file = ".env"
@@ -1,21 +1,36 @@
-from fastapi import Cookie, Depends, HTTPException, status
+import hmac
+
+from fastapi import Cookie, Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import settings_config
-from app.db.database import get_db
+from app.core.user_cache import user_cache
+from app.db.database import get_async_db
+from app.exceptions.security import AdminRequiredException
 from app.schemas.user import TokenPayload, User
-from app.services.user_service import UserService
+from app.services.user_service import AsyncUserService
 
 # Define OAuth2PasswordBearer with the login endpoint
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-async def get_current_user(
-    access_token: str = Cookie(None, alias="access_token"),
-    db: Session = Depends(get_db),
-) -> User:
+async def authenticate_access_token(access_token: str | None, db: AsyncSession) -> User:
+    """
+    Resolve the user an access token cookie belongs to
+
+    Args:
+        access_token (str | None): The access_token cookie value
+        db (AsyncSession): The async database session, used on a cache miss
+
+    Returns:
+        User: The authenticated user
+
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or expired, or its
+            user no longer exists
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or expired token!",
@@ -37,12 +52,67 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = UserService.get_user_by_email(db=db, email=token_data.sub)
+    cached_user = user_cache.get(token_data.sub)
+    if cached_user is not None:
+        return cached_user
+
+    user = await AsyncUserService.get_user_by_email(
+        db=db, email=token_data.sub, use_replica=True
+    )
     if user is None:
         raise credentials_exception
 
-    return user
+    current_user = User.model_validate(user)
+    user_cache.set(token_data.sub, current_user)
+    return current_user
+
+
+async def get_current_user(
+    access_token: str = Cookie(None, alias="access_token"),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    return await authenticate_access_token(access_token, db)
 
 
 def require_auth(current_user: User = Depends(get_current_user)):
     return current_user
+
+
+def require_admin(current_user: User = Depends(get_current_user)):
+    """
+    Allow only users listed in the ADMIN_EMAILS setting
+
+    Raises:
+        AdminRequiredException: 403 for any other authenticated user
+    """
+    admin_emails = {
+        email.strip().lower()
+        for email in settings_config.ADMIN_EMAILS.split(",")
+        if email.strip()
+    }
+    if current_user.email.lower() not in admin_emails:
+        raise AdminRequiredException()
+    return current_user
+
+
+async def require_metrics_access(
+    authorization: str | None = Header(None),
+    access_token: str = Cookie(None, alias="access_token"),
+    db: AsyncSession = Depends(get_async_db),
+) -> None:
+    """
+    Allow scrapers presenting the METRICS_TOKEN bearer token, or an
+    administrator's session
+
+    Raises:
+        HTTPException: 401 without a valid token or session
+        AdminRequiredException: 403 for a session of a non-administrator
+    """
+    token = settings_config.METRICS_TOKEN
+    if token and authorization:
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            credentials.strip().encode(), token.encode()
+        ):
+            return
+    require_admin(await authenticate_access_token(access_token, db))
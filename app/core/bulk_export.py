@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+import re
+import zlib
+from typing import Any, AsyncIterator, Sequence
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# Leading characters that make spreadsheet applications evaluate a cell as a
+# formula (tab and carriage return included, as OWASP recommends)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Signed numbers and phone numbers ("+1 555-0100", "-12.5") start with + or -
+# but are read as values, not formulas
+_PLAIN_NUMBER = re.compile(r"[+-]?[\d\s().-]+")
+
+
+def _is_formula(value: str) -> bool:
+    return value.startswith(_FORMULA_PREFIXES) and not _PLAIN_NUMBER.fullmatch(value)
+
+
+def escape_csv_cell(value: Any) -> Any:
+    """
+    Prefix text cells a spreadsheet would run as a formula with a quote
+
+    Cells that already start with quotes before a formula get one more, so
+    unescape_csv_cell can always strip exactly one and a CSV export
+    re-imports unchanged.
+    """
+    if isinstance(value, str) and _is_formula(value.lstrip("'")):
+        return "'" + value
+    return value
+
+
+def unescape_csv_cell(value: str) -> str:
+    """Undo escape_csv_cell on a cell read back from a CSV export"""
+    if value.startswith("'") and _is_formula(value[1:].lstrip("'")):
+        return value[1:]
+    return value
+
+
+async def iter_csv_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Sequence]]
+) -> AsyncIterator[bytes]:
+    """Render batches of rows as CSV, one output chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    # Send the header before the first query round trip completes
+    yield buffer.getvalue().encode()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([escape_csv_cell(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode()
+
+
+async def iter_ndjson_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Sequence]]
+) -> AsyncIterator[bytes]:
+    """Render batches of rows as newline-delimited JSON, one chunk per batch"""
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), default=str) + "\n" for row in batch
+        ).encode()
+
+
+async def gzip_chunks(
+    chunks: AsyncIterator[bytes], level: int = 6
+) -> AsyncIterator[bytes]:
+    """Gzip a byte stream incrementally, flushing after every chunk"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
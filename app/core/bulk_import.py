@@ -0,0 +1,116 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator
+
+from app.core.bulk_export import unescape_csv_cell
+
+SUPPORTED_FORMATS = ("csv", "ndjson")
+
+CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def detect_format(content_type: str | None) -> str | None:
+    """
+    Map a request Content-Type to an import format
+
+    Args:
+        content_type (str | None): The Content-Type header value
+
+    Returns:
+        str | None: "csv", "ndjson" or None if the type is not supported
+    """
+    if not content_type:
+        return None
+    return CONTENT_TYPE_FORMATS.get(content_type.split(";")[0].strip().lower())
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 byte chunks into lines without buffering the body"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_csv_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[dict | None, str | None]]:
+    """
+    Parse a streamed CSV body with a header row into records
+
+    Yields:
+        tuple[dict | None, str | None]: The record, or an error message for
+            rows that could not be parsed
+    """
+    header = None
+    pending: list[str] = []
+    async for line in iter_lines(chunks):
+        pending.append(line)
+        text = "\n".join(pending)
+        # An odd number of quotes means a quoted field continues on the next line
+        if text.count('"') % 2:
+            continue
+        pending = []
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            yield None, f"Malformed CSV row: {str(e)}"
+            continue
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        if len(values) != len(header):
+            yield None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Cells escaped against formula injection by the CSV export
+        yield dict(zip(header, map(unescape_csv_cell, values))), None
+
+    if pending:
+        yield None, "Unterminated quoted field at end of input"
+
+
+async def iter_ndjson_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[dict | None, str | None]]:
+    """
+    Parse a streamed newline-delimited JSON body into records
+
+    Yields:
+        tuple[dict | None, str | None]: The record, or an error message for
+            lines that could not be parsed
+    """
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield None, f"Malformed JSON: {str(e)}"
+            continue
+        if not isinstance(record, dict):
+            yield None, "Expected a JSON object"
+            continue
+        yield record, None
+
+
+def iter_records(
+    chunks: AsyncIterator[bytes], format: str
+) -> AsyncIterator[tuple[dict | None, str | None]]:
+    if format == "csv":
+        return iter_csv_records(chunks)
+    return iter_ndjson_records(chunks)
@@ -0,0 +1,273 @@
+import re
+import zlib
+from typing import Callable, Iterable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class StreamCompressor(Protocol):
+    """Incremental compressor with a flush after every chunk"""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        # Brotli qualities run 0-11; map the shared 1-9 level onto them
+        self._compressor = brotli.Compressor(quality=min(11, max(0, level + 1)))
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encoders() -> dict[str, Callable[[int], StreamCompressor]]:
+    """Encodings usable in this environment, keyed by Content-Encoding token"""
+    encoders = {"gzip": GzipCompressor}
+    if brotli is not None:
+        encoders["br"] = BrotliCompressor
+    if zstandard is not None:
+        encoders["zstd"] = ZstdCompressor
+    return encoders
+
+
+def choose_encoding(accept_encoding: str, preferred: Iterable[str]) -> str | None:
+    """
+    Pick the first of our preferred encodings the client accepts
+
+    Args:
+        accept_encoding (str): The Accept-Encoding request header
+        preferred (Iterable[str]): Encodings we can produce, best first
+
+    Returns:
+        str | None: The chosen encoding, or None to send the body as-is
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        token, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.strip()] = quality
+
+    for encoding in preferred:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def encoding_etag(etag: str, encoding: str) -> str:
+    """
+    The ETag of the ``encoding`` representation of a response
+
+    Compressed and identity bodies differ byte for byte, so they must not
+    share a strong validator.
+
+    Args:
+        etag (str): The quoted (optionally W/-prefixed) ETag of the body
+        encoding (str): The Content-Encoding applied
+
+    Returns:
+        str: The ETag with "-<encoding>" appended inside the quotes
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with gzip, and br / zstd when their
+    packages are installed.
+
+    Only responses whose media type is in ``content_types`` and whose body
+    reaches ``minimum_size`` are compressed; responses that already carry a
+    Content-Encoding (e.g. ``/api/suppliers/export?gzip=true``) pass through.
+    Streaming bodies are buffered only until ``minimum_size`` is reached and
+    are then compressed chunk by chunk with a flush after each chunk, so
+    clients keep receiving data as it is produced.
+
+    Compressed responses get their ETag suffixed with the encoding (see
+    encoding_etag), and the suffix is stripped from If-None-Match / If-Match
+    on the way in, so the application only ever sees its own validators.
+    Every response of a compressible type carries Vary: Accept-Encoding,
+    compressed or not, so shared caches keep the representations apart.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        level: int = 6,
+        content_types: Iterable[str] = ("application/json",),
+        encodings: Iterable[str] = ("zstd", "br", "gzip"),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.content_types = frozenset(content_types)
+        encoders = available_encoders()
+        self.encoders = {
+            encoding: encoders[encoding]
+            for encoding in encodings
+            if encoding in encoders
+        }
+        self._etag_suffix = re.compile(
+            rb"-(?:%s)\"" % b"|".join(re.escape(name.encode()) for name in encoders)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match", "")
+        encoding = choose_encoding(
+            request_headers.get("accept-encoding", ""), self.encoders
+        )
+        scope = self.strip_etag_suffixes(scope)
+
+        start_message: Message | None = None
+        buffered: list[bytes] = []
+        buffered_size = 0
+        compressor: StreamCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, buffered_size, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").split(";")[0].strip()
+                compressible = (
+                    "content-encoding" not in headers
+                    and media_type in self.content_types
+                    and message["status"] >= 200
+                )
+                if compressible:
+                    MutableHeaders(raw=message["headers"]).add_vary_header(
+                        "Accept-Encoding"
+                    )
+                if message["status"] == 304 and encoding is not None:
+                    # Confirm the validator of the representation the client
+                    # holds, which may be the compressed one
+                    etag = headers.get("etag")
+                    if etag and encoding_etag(etag, encoding) in if_none_match:
+                        MutableHeaders(raw=message["headers"])["ETag"] = (
+                            encoding_etag(etag, encoding)
+                        )
+                passthrough = (
+                    not compressible
+                    or encoding is None
+                    or message["status"] in (204, 304)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                buffered.append(body)
+                buffered_size += len(body)
+                if more_body and buffered_size < self.minimum_size:
+                    return
+
+                body = b"".join(buffered)
+                buffered.clear()
+                if not more_body and buffered_size < self.minimum_size:
+                    # Small complete body: not worth the CPU or the header bytes
+                    passthrough = True
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                compressor = self.encoders[encoding](self.level)
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers:
+                    headers["ETag"] = encoding_etag(headers["etag"], encoding)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    data = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(data))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": data})
+                    return
+                await send(start_message)
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            if data or not more_body:
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+
+        await self.app(scope, receive, send_compressed)
+
+    def strip_etag_suffixes(self, scope: Scope) -> Scope:
+        """Remove encoding_etag suffixes from the request's conditional headers"""
+        headers = []
+        changed = False
+        for name, value in scope["headers"]:
+            if name in (b"if-none-match", b"if-match"):
+                stripped = self._etag_suffix.sub(b'"', value)
+                changed = changed or stripped != value
+                value = stripped
+            headers.append((name, value))
+        return {**scope, "headers": headers} if changed else scope
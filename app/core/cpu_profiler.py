@@ -0,0 +1,305 @@
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import FrameType
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import settings_config
+from app.exceptions.profiler import (
+    ProfilerAlreadyRunningException,
+    ProfilerNotRunningException,
+)
+
+
+def _thread_cpu_seconds(ident: int) -> float | None:
+    # CPU time consumed by another thread, where the platform exposes it
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError):
+        return None
+
+
+def collapse_stack(frame: FrameType, thread_name: str) -> str:
+    """
+    Render a stack in the folded format read by flamegraph.pl and speedscope
+
+    Args:
+        frame (FrameType): The innermost frame of the stack
+        thread_name (str): Name of the thread, used as the root frame
+
+    Returns:
+        str: "thread;outermost;...;innermost", one "module:function" per frame
+    """
+    names = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        # co_qualname only exists from Python 3.11
+        name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+        names.append(f"{module}:{name}".replace(";", ","))
+        frame = frame.f_back
+    names.append(thread_name.replace(";", ","))
+    return ";".join(reversed(names))
+
+
+class ProfileSession:
+    """One profiling run and the stacks sampled during it"""
+
+    def __init__(self, path: str, seconds: float, sample_rate: float | None):
+        self.path = path
+        self.seconds = seconds
+        self.sample_rate = sample_rate
+        self.started_at = datetime.now(timezone.utc)
+        self.deadline = time.monotonic() + seconds
+        self.stacks: dict[str, int] = {}
+        self.samples = 0
+        self.finished = threading.Event()
+        self.stopped = threading.Event()
+
+    def record(self, stack: str, weight: int) -> None:
+        self.samples += 1
+        self.stacks[stack] = self.stacks.get(stack, 0) + weight
+
+    def write(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        partial = f"{self.path}.part"
+        with open(partial, "w", encoding="utf-8") as output:
+            for stack, weight in sorted(self.stacks.items()):
+                output.write(f"{stack} {weight}\n")
+        os.replace(partial, self.path)
+
+    def describe(self) -> dict:
+        return {
+            "running": not self.finished.is_set(),
+            "mode": "process" if self.sample_rate is None else "requests",
+            "sample_rate": self.sample_rate,
+            "started_at": self.started_at,
+            "ends_at": self.started_at + timedelta(seconds=self.seconds),
+            "samples": self.samples,
+            "output_file": self.path,
+        }
+
+
+class SamplingProfiler:
+    """
+    Sampling CPU profiler for a running worker.
+
+    While a session runs, a background thread wakes every ``interval_seconds``
+    and reads the stack of every other thread. Each stack is weighted by the
+    CPU time its thread used since the previous sample (in microseconds), so
+    threads blocked on I/O or locks contribute nothing and the output shows
+    where CPU actually went. Where per-thread CPU clocks are unavailable
+    every stack counts as one interval. The stacks are written in the folded
+    format, one "frame;frame;frame weight" line per stack, which flamegraph.pl,
+    speedscope and similar tools read directly.
+
+    Only the newest ``max_files`` output files are kept in ``output_dir``;
+    older ones are deleted whenever a session writes its output.
+
+    Nothing runs between sessions. A session either covers the whole process
+    for a number of seconds, or, with a ``sample_rate``, only the moments when
+    one of that fraction of requests is in flight (see CPUProfilerMiddleware).
+    Requests share the event loop thread, so requests running concurrently
+    with a sampled one are captured with it.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        interval_seconds: float,
+        max_seconds: float,
+        max_files: int = 20,
+    ):
+        self.output_dir = output_dir
+        self.interval_seconds = interval_seconds
+        self.max_seconds = max_seconds
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._session: ProfileSession | None = None
+        self._active_requests = 0
+        # Read without the lock by CPUProfilerMiddleware on every request
+        self.sample_rate = 0.0
+        self.sessions = 0
+        self.sampled_requests = 0
+        self.samples = 0
+
+    def start(self, seconds: float, sample_rate: float | None = None) -> dict:
+        """
+        Start a profiling session
+
+        Args:
+            seconds (float): How long to profile, capped at ``max_seconds``
+            sample_rate (float | None): Fraction of requests to profile, or
+                None to profile the whole process
+
+        Returns:
+            dict: The session status
+
+        Raises:
+            ProfilerAlreadyRunningException: If a session is already running
+        """
+        with self._lock:
+            if self._session is not None and not self._session.finished.is_set():
+                raise ProfilerAlreadyRunningException()
+            started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+            session = ProfileSession(
+                path=os.path.join(
+                    self.output_dir, f"cpu-{started}-{os.getpid()}.folded"
+                ),
+                seconds=min(seconds, self.max_seconds),
+                sample_rate=sample_rate,
+            )
+            self._session = session
+            self.sample_rate = sample_rate or 0.0
+            self.sessions += 1
+            threading.Thread(
+                target=self._run, args=(session,), name="cpu-profiler", daemon=True
+            ).start()
+            return session.describe()
+
+    def stop(self) -> dict:
+        """
+        End the running session early and write its output
+
+        Returns:
+            dict: The status of the finished session
+
+        Raises:
+            ProfilerNotRunningException: If no session is running
+        """
+        with self._lock:
+            session = self._session
+            if session is None or session.finished.is_set():
+                raise ProfilerNotRunningException()
+            session.stopped.set()
+        session.finished.wait()
+        return session.describe()
+
+    def status(self) -> dict | None:
+        """Status of the running or most recent session, if any"""
+        session = self._session
+        return session.describe() if session is not None else None
+
+    def profiles(self) -> list[str]:
+        """Output files in ``output_dir``, newest first"""
+        try:
+            names = os.listdir(self.output_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            (
+                os.path.join(self.output_dir, name)
+                for name in names
+                if name.endswith(".folded")
+            ),
+            reverse=True,
+        )
+
+    def prune(self) -> None:
+        """Delete all but the newest ``max_files`` output files"""
+        for path in self.profiles()[self.max_files :]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another worker sharing output_dir got there first
+                pass
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._active_requests += 1
+            self.sampled_requests += 1
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._active_requests -= 1
+
+    def stats(self) -> dict:
+        session = self._session
+        return {
+            "running": int(session is not None and not session.finished.is_set()),
+            "sessions": self.sessions,
+            "sampled_requests": self.sampled_requests,
+            "samples": self.samples,
+        }
+
+    def _run(self, session: ProfileSession) -> None:
+        own_ident = threading.get_ident()
+        cpu_seconds: dict[int, float] = {}
+        interval_weight = max(1, round(self.interval_seconds * 1_000_000))
+        try:
+            while not session.stopped.wait(self.interval_seconds):
+                if time.monotonic() >= session.deadline:
+                    break
+                recording = session.sample_rate is None or self._active_requests > 0
+                thread_names = {
+                    thread.ident: thread.name for thread in threading.enumerate()
+                }
+                for ident, frame in sys._current_frames().items():
+                    if ident == own_ident:
+                        continue
+                    # The CPU baseline advances even while not recording, so
+                    # time spent between sampled requests is not attributed
+                    # to the next one
+                    now = _thread_cpu_seconds(ident)
+                    if now is None:
+                        weight = interval_weight
+                    else:
+                        previous = cpu_seconds.get(ident, now)
+                        cpu_seconds[ident] = now
+                        weight = round((now - previous) * 1_000_000)
+                    if not recording or weight <= 0:
+                        continue
+                    session.record(
+                        collapse_stack(frame, thread_names.get(ident, str(ident))),
+                        weight,
+                    )
+                    self.samples += 1
+        finally:
+            with self._lock:
+                self.sample_rate = 0.0
+            try:
+                session.write()
+                self.prune()
+            finally:
+                session.finished.set()
+
+
+class CPUProfilerMiddleware:
+    """
+    ASGI middleware marking which requests a sampled profiling session
+    covers.
+
+    Between sessions, and during whole-process sessions, each request costs
+    one attribute read.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: SamplingProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        sample_rate = self.profiler.sample_rate
+        if (
+            not sample_rate
+            or scope["type"] != "http"
+            or random.random() >= sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        self.profiler.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.request_finished()
+
+
+cpu_profiler = SamplingProfiler(
+    output_dir=settings_config.CPU_PROFILE_OUTPUT_DIR,
+    interval_seconds=settings_config.CPU_PROFILE_INTERVAL_MS / 1000,
+    max_seconds=settings_config.CPU_PROFILE_MAX_SECONDS,
+    max_files=settings_config.CPU_PROFILE_MAX_FILES,
+)
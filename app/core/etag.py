@@ -0,0 +1,88 @@
+import hashlib
+from typing import Iterable
+
+
+def version_etag(version: int) -> str:
+    """
+    Strong ETag for a single row version
+
+    Args:
+        version (int): The row version
+
+    Returns:
+        str: The quoted ETag value
+    """
+    return f'"v{version}"'
+
+
+def collection_etag(rows: Iterable[tuple], *extra) -> str:
+    """
+    Strong ETag for a list response built from (id, version) pairs
+
+    Args:
+        rows (Iterable[tuple]): (id, version) of every row in the response
+        *extra: Anything else that changes the body, e.g. the next cursor
+
+    Returns:
+        str: The quoted ETag value
+    """
+    digest = hashlib.sha1()
+    for row_id, version in rows:
+        digest.update(f"{row_id}:{version};".encode())
+    for value in extra:
+        digest.update(f"|{value}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def parse_etags(header: str | None) -> list[str] | None:
+    """
+    Parse an If-Match / If-None-Match header into its entity tags
+
+    Args:
+        header (str | None): The raw header value
+
+    Returns:
+        list[str] | None: The quoted tags (weak ones keep their W/ prefix),
+            ["*"] for a wildcard, or None when the header is absent
+    """
+    if header is None:
+        return None
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def none_match(header: str | None, etag: str) -> bool:
+    """
+    Whether If-None-Match matches ``etag`` (weak comparison, RFC 9110 13.1.2)
+
+    Args:
+        header (str | None): The raw If-None-Match header
+        etag (str): The current ETag of the resource
+
+    Returns:
+        bool: True when the client's copy is current and a 304 can be sent
+    """
+    tags = parse_etags(header)
+    if not tags:
+        return False
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def match_versions(header: str | None) -> list[int] | None:
+    """
+    Row versions accepted by an If-Match header (strong comparison)
+
+    Args:
+        header (str | None): The raw If-Match header
+
+    Returns:
+        list[int] | None: The versions the write may apply to, None when any
+            version is acceptable (no header or "*")
+    """
+    tags = parse_etags(header)
+    if not tags or "*" in tags:
+        return None
+    versions = []
+    for tag in tags:
+        if tag.startswith('"v') and tag.endswith('"') and tag[2:-1].isdigit():
+            versions.append(int(tag[2:-1]))
+    return versions
@@ -0,0 +1,263 @@
+import asyncio
+import contextlib
+import logging
+from typing import Callable, Protocol
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.settings import settings_config
+from app.core.response_cache import load_backend
+from app.db.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastBackend(Protocol):
+    """
+    Cross-worker transport for EventHub messages.
+
+    Every message published by any worker is handed to the ``deliver``
+    callback of every listening worker, the publisher's own included.
+    """
+
+    async def publish(self, message: str) -> None: ...
+
+    async def listen(self, deliver: Callable[[str], None]) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryBroadcastBackend:
+    """
+    In-process BroadcastBackend. Hubs sharing one instance behave like
+    workers sharing a real backend, which is what tests need.
+    """
+
+    def __init__(self):
+        self._listeners: list[Callable[[str], None]] = []
+
+    async def publish(self, message: str) -> None:
+        for deliver in list(self._listeners):
+            deliver(message)
+
+    async def listen(self, deliver: Callable[[str], None]) -> None:
+        self._listeners.append(deliver)
+
+    async def close(self) -> None:
+        self._listeners.clear()
+
+
+class PostgresNotifyBackend:
+    """
+    BroadcastBackend over Postgres LISTEN/NOTIFY.
+
+    Messages are sent with pg_notify on a pooled connection. Each worker
+    listens on one dedicated asyncpg connection outside the pool and
+    reconnects after ``retry_seconds`` when it drops; messages sent while it
+    is down are missed, so clients should catch up through the change feed
+    after reconnecting. NOTIFY payloads are limited to 8000 bytes.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, channel: str, retry_seconds: float = 1.0
+    ):
+        self.engine = engine
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+        self._task: asyncio.Task | None = None
+        self.reconnects = 0
+
+    async def publish(self, message: str) -> None:
+        async with self.engine.connect() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :message)"),
+                {"channel": self.channel, "message": message},
+            )
+            await connection.commit()
+
+    async def listen(self, deliver: Callable[[str], None]) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(deliver))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _listen(self, deliver: Callable[[str], None]) -> None:
+        # Only this backend needs asyncpg; SQLite deployments may not have it
+        import asyncpg
+
+        dsn = self.engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+            except Exception:
+                logger.warning("Cannot connect to LISTEN for events", exc_info=True)
+                await asyncio.sleep(self.retry_seconds)
+                continue
+
+            # Anything but cancellation (a BaseException) ends in a reconnect;
+            # a listener that died here would cut this worker off for good
+            closed = asyncio.Event()
+            try:
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(
+                    self.channel,
+                    lambda _conn, _pid, _channel, payload: deliver(payload),
+                )
+                await closed.wait()
+            except Exception:
+                logger.warning("LISTEN for events failed", exc_info=True)
+            finally:
+                if not connection.is_closed():
+                    try:
+                        await connection.close()
+                    except Exception:
+                        connection.terminate()
+            self.reconnects += 1
+            await asyncio.sleep(self.retry_seconds)
+
+
+class Subscription:
+    """Bounded queue of messages for one subscriber; iterate to consume"""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        # One extra slot so the end-of-stream marker always fits
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(queue_size + 1)
+        self.evicted = False
+
+    def offer(self, message: str) -> bool:
+        """Queue a message, or evict the subscriber when its queue is full"""
+        if self._queue.qsize() >= self.queue_size:
+            self.evicted = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return False
+        self._queue.put_nowait(message)
+        return True
+
+    def end(self) -> None:
+        self._queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class EventHub:
+    """
+    Fans published messages out to in-process subscribers.
+
+    Messages are delivered as already-serialized strings, so a message is
+    encoded once however many subscribers receive it. Each subscriber has a
+    bounded queue; one that falls ``queue_size`` messages behind (a slow or
+    stalled client) is evicted instead of buffering without bound. With a
+    backend, messages travel through it so subscribers on every worker
+    receive them.
+    """
+
+    def __init__(self, queue_size: int, backend: BroadcastBackend | None = None):
+        self.queue_size = queue_size
+        self.backend = backend
+        self._subscriptions: set[Subscription] = set()
+        self._listening = False
+        self.published = 0
+        self.delivered = 0
+        self.evictions = 0
+        self.publish_errors = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether a published message can reach any subscriber"""
+        return self.backend is not None or bool(self._subscriptions)
+
+    async def subscribe(self) -> Subscription:
+        if self.backend is not None and not self._listening:
+            self._listening = True
+            await self.backend.listen(self._deliver)
+        subscription = Subscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    async def publish(self, message: str) -> None:
+        """
+        Publish a message to every subscriber
+
+        Broadcast failures are logged and counted rather than raised: the
+        write that produced the event has already been committed.
+
+        Args:
+            message (str): The serialized message
+        """
+        self.published += 1
+        if self.backend is None:
+            self._deliver(message)
+            return
+        try:
+            await self.backend.publish(message)
+        except Exception:
+            self.publish_errors += 1
+            logger.exception("Failed to broadcast event")
+
+    async def close(self) -> None:
+        for subscription in list(self._subscriptions):
+            subscription.end()
+        self._subscriptions.clear()
+        if self.backend is not None:
+            await self.backend.close()
+            self._listening = False
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscriptions),
+            "published": self.published,
+            "delivered": self.delivered,
+            "evictions": self.evictions,
+            "publish_errors": self.publish_errors,
+        }
+
+    def _deliver(self, message: str) -> None:
+        for subscription in list(self._subscriptions):
+            if subscription.offer(message):
+                self.delivered += 1
+            else:
+                self.evictions += 1
+                self._subscriptions.discard(subscription)
+
+
+def load_broadcast_backend(path: str) -> BroadcastBackend | None:
+    """
+    Build the broadcast backend named in settings
+
+    Args:
+        path (str): "postgres" for LISTEN/NOTIFY on the primary database, a
+            "module:attribute" path, or empty for this worker only
+
+    Returns:
+        BroadcastBackend | None: The backend, or None for in-process delivery
+    """
+    if path == "postgres":
+        return PostgresNotifyBackend(async_engine, channel="supplier_events")
+    return load_backend(path)
+
+
+supplier_events = EventHub(
+    queue_size=settings_config.SUPPLIER_EVENTS_QUEUE_SIZE,
+    backend=load_broadcast_backend(settings_config.SUPPLIER_EVENTS_BACKEND),
+)
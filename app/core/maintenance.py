@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from app.config.settings import settings_config
+from app.db.database import AsyncSessionLocal
+from app.services.supplier_service import AsyncSupplierService
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Runs a coroutine function every ``interval_seconds`` in the background.
+
+    A failed run is logged and retried on the next interval. Every worker
+    runs its own task, so the job must be safe to run concurrently.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[object]],
+        interval_seconds: float,
+    ):
+        self.name = name
+        self.job = job
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.job()
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+            await asyncio.sleep(self.interval_seconds)
+
+
+async def prune_supplier_tombstones() -> None:
+    async with AsyncSessionLocal() as db:
+        pruned = await AsyncSupplierService.prune_tombstones(
+            db, timedelta(days=settings_config.SUPPLIER_TOMBSTONE_RETENTION_DAYS)
+        )
+    if pruned:
+        logger.info("Pruned %d supplier tombstones", pruned)
+
+
+tombstone_pruner = PeriodicTask(
+    "prune_supplier_tombstones",
+    prune_supplier_tombstones,
+    settings_config.SUPPLIER_TOMBSTONE_PRUNE_INTERVAL_SECONDS,
+)
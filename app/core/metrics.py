@@ -0,0 +1,358 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple) -> str:
+    if not labelnames:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, *labels, value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts followed by sum and count
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series = sorted(
+                (labels, list(values)) for labels, values in self._series.items()
+            )
+        lines = self.header()
+        bucket_labelnames = self.labelnames + ("le",)
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    bucket_labelnames, labels + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(values[-2])}")
+            lines.append(f"{self.name}_count{label_text} {values[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Minimal in-process metrics registry rendered in the Prometheus text format.
+
+    Values live in the worker process, so each uvicorn worker exposes its own
+    series; scrape every worker (or aggregate by instance) as usual.
+    """
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Register a callable producing metrics computed at scrape time"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS_TOTAL = registry.counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled"
+)
+HTTP_REQUEST_ERRORS_TOTAL = registry.counter(
+    "http_request_errors_total",
+    "HTTP requests that ended in a 5xx response or an unhandled exception",
+    ("method", "route"),
+)
+DB_QUERIES_TOTAL = registry.counter(
+    "db_queries_total", "SQL statements executed", ("engine",)
+)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request",
+    "SQL statements executed while handling one HTTP request",
+    ("method", "route"),
+    buckets=DEFAULT_COUNT_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection",
+)
+DB_POOL_TIMEOUTS_TOTAL = registry.counter(
+    "db_pool_timeouts_total",
+    "Checkouts rejected because no pooled connection freed up in time",
+)
+
+# Number of SQL statements run by the current request, when inside one
+_request_query_count: ContextVar[list[int] | None] = ContextVar(
+    "request_query_count", default=None
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording how long each checkout waited"""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(value=time.perf_counter() - started_at)
+
+
+_tracked_engines: dict[str, Engine] = {}
+
+
+def track_engine(name: str, engine: Engine) -> None:
+    """
+    Count statements run on ``engine`` and export its pool state
+
+    Args:
+        name (str): The engine label used in the exported series
+        engine (Engine): A sync engine, or ``AsyncEngine.sync_engine``
+    """
+    if name in _tracked_engines:
+        return
+    _tracked_engines[name] = engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        DB_QUERIES_TOTAL.inc(name)
+        request_count = _request_query_count.get()
+        if request_count is not None:
+            request_count[0] += 1
+
+
+def _collect_pool_stats() -> Iterable[Metric]:
+    size = Gauge("db_pool_size", "Configured pool size", ("engine",))
+    checked_out = Gauge(
+        "db_pool_checked_out", "Connections currently checked out", ("engine",)
+    )
+    overflow = Gauge(
+        "db_pool_overflow", "Connections open beyond pool size", ("engine",)
+    )
+    idle = Gauge("db_pool_checked_in", "Idle connections in the pool", ("engine",))
+    for name, engine in _tracked_engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        size.set(name, value=pool.size())
+        checked_out.set(name, value=pool.checkedout())
+        overflow.set(name, value=max(pool.overflow(), 0))
+        idle.set(name, value=pool.checkedin())
+    return (size, checked_out, overflow, idle)
+
+
+registry.register_collector(_collect_pool_stats)
+
+
+def stats_collector(
+    prefix: str, stats: Callable[[], dict], help: str
+) -> Callable[[], Iterable[Metric]]:
+    """
+    Build a collector exporting the numeric values of a ``stats()`` dict
+
+    Args:
+        prefix (str): Metric name prefix, e.g. "user_cache"
+        stats (Callable[[], dict]): Returns the current stats
+        help (str): Help text shared by the exported series
+
+    Returns:
+        Callable[[], Iterable[Metric]]: A collector for register_collector
+    """
+
+    def collect() -> Iterable[Metric]:
+        metrics = []
+        for key, value in stats().items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            gauge = Gauge(f"{prefix}_{key}", help)
+            gauge.set(value=value)
+            metrics.append(gauge)
+        return metrics
+
+    return collect
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request counts, latency, in-flight
+    requests, errors and SQL statements per request.
+
+    Routes are labelled with their path template (``/api/suppliers/{supplier_id}``)
+    so series cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        query_count = [0]
+        token = _request_query_count.set(query_count)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            _request_query_count.reset(token)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS_TOTAL.inc(method, route_path, str(status_code))
+            HTTP_REQUEST_DURATION_SECONDS.observe(method, route_path, value=elapsed)
+            DB_QUERIES_PER_REQUEST.observe(method, route_path, value=query_count[0])
+            if status_code >= 500:
+                HTTP_REQUEST_ERRORS_TOTAL.inc(method, route_path)
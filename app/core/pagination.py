@@ -0,0 +1,39 @@
+import base64
+import json
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor
+
+    Args:
+        values (list): JSON-serializable sort key values
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor (str): The opaque cursor
+
+    Returns:
+        list: The decoded sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
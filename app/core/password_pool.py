@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.config.settings import settings_config
+from app.exceptions.security import PasswordWorkerPoolFullException
+
+
+class PasswordWorkerPool:
+    """
+    Dedicated thread pool for bcrypt hashing/verification.
+
+    bcrypt releases the GIL while hashing, so running it on a small pool keeps
+    the event loop free. ``max_pending`` bounds the number of calls that may be
+    queued or running at once; callers beyond that are rejected with a 503
+    instead of piling up behind the workers.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, sample_size: int = 1024):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._run_samples: deque[float] = deque(maxlen=sample_size)
+        self.calls = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordWorkerPoolFullException()
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+
+        def timed_call():
+            started_at = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                finished_at = time.perf_counter()
+                with self._lock:
+                    self.calls += 1
+                    self.total_wait_seconds += started_at - submitted_at
+                    self.total_run_seconds += finished_at - started_at
+                    self._run_samples.append(finished_at - started_at)
+
+        def release(_future: Future) -> None:
+            with self._lock:
+                self._pending -= 1
+
+        # The slot is released when the worker is done with the call, not when
+        # the caller stops waiting: a cancelled caller leaves bcrypt running
+        try:
+            future = self._executor.submit(timed_call)
+        except BaseException:
+            release(None)
+            raise
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = sorted(self._run_samples)
+            stats = {
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "pending": self._pending,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "total_wait_seconds": self.total_wait_seconds,
+                "total_run_seconds": self.total_run_seconds,
+            }
+        for name, quantile in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            stats[f"run_seconds_{name}"] = (
+                samples[min(len(samples) - 1, int(len(samples) * quantile))]
+                if samples
+                else None
+            )
+        return stats
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_pool = PasswordWorkerPool(
+    max_workers=settings_config.PASSWORD_HASH_WORKERS,
+    max_pending=settings_config.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,200 @@
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+from app.config.settings import settings_config
+
+
+class CacheBackend(Protocol):
+    """
+    Shared cache backend, e.g. a thin wrapper around a Redis client.
+
+    Values are opaque bytes. Counters created by ``incr`` must not expire or
+    be evicted, since they hold the cache generation.
+    """
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU with per-entry TTL implementing CacheBackend.
+
+    Used as the local tier of ResponseCache, and usable as a stand-in for the
+    shared backend in development.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    async def get(self, key: str) -> bytes | None:
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is not None:
+                return str(counter).encode()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Cache of pre-serialized JSON responses with generation-based invalidation.
+
+    Keys are prefixed with the current generation, so a write invalidates
+    every cached response at once by bumping the generation; stale entries
+    are never read again and age out of the LRU. With a shared backend the
+    generation lives there, so a write on one worker invalidates all workers,
+    and the local LRU acts as a first tier in front of it.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local: MemoryCacheBackend,
+        ttl_seconds: float,
+        shared: CacheBackend | None = None,
+    ):
+        self.namespace = namespace
+        self.local = local
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+        self._generation_key = f"{namespace}:generation"
+        self._generation: int | None = None
+        # monotonic time this worker last saw the generation change
+        self._generation_changed_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def generation(self) -> int:
+        value = await (self.shared or self.local).get(self._generation_key)
+        generation = int(value) if value else 0
+        if generation != self._generation:
+            self._generation = generation
+            self._generation_changed_at = time.monotonic()
+        return generation
+
+    def changed_within(self, seconds: float) -> bool:
+        """
+        Whether the generation changed in the last ``seconds`` as far as this
+        worker knows, i.e. whether the write behind it may not have reached
+        the read replicas yet
+        """
+        return time.monotonic() - self._generation_changed_at < seconds
+
+    async def get(self, key: str, generation: int) -> tuple[str, bytes] | None:
+        """
+        Look up a cached response
+
+        Args:
+            key (str): The response key, e.g. "list:0:100"
+            generation (int): The generation read before querying the database
+
+        Returns:
+            tuple[str, bytes] | None: The ETag and JSON body, or None on a miss
+        """
+        full_key = f"{self.namespace}:{generation}:{key}"
+        value = await self.local.get(full_key)
+        if value is None and self.shared is not None:
+            value = await self.shared.get(full_key)
+            if value is not None:
+                await self.local.set(full_key, value, self.ttl_seconds)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        etag, _, content = value.partition(b"\n")
+        return etag.decode(), content
+
+    async def set(self, key: str, generation: int, etag: str, content: bytes) -> None:
+        """
+        Store a response under the generation it was read at
+
+        A response built from data read before a concurrent write lands under
+        the old generation, so it can never be served after the write.
+
+        Args:
+            key (str): The response key
+            generation (int): The generation read before querying the database
+            etag (str): The response ETag
+            content (bytes): The serialized JSON body
+        """
+        full_key = f"{self.namespace}:{generation}:{key}"
+        value = etag.encode() + b"\n" + content
+        await self.local.set(full_key, value, self.ttl_seconds)
+        if self.shared is not None:
+            await self.shared.set(full_key, value, self.ttl_seconds)
+
+    async def invalidate(self) -> None:
+        self.invalidations += 1
+        self._generation_changed_at = time.monotonic()
+        await (self.shared or self.local).incr(self._generation_key)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.local.evictions,
+            "size": len(self.local),
+            "max_size": self.local.max_size,
+        }
+
+
+def load_backend(path: str) -> CacheBackend | None:
+    """
+    Load a shared backend from a "module:attribute" path
+
+    Args:
+        path (str): e.g. "myproject.cache:redis_backend"; empty for none
+
+    Returns:
+        CacheBackend | None: The backend object, or None when path is empty
+    """
+    if not path:
+        return None
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+supplier_cache = ResponseCache(
+    namespace="suppliers",
+    local=MemoryCacheBackend(max_size=settings_config.SUPPLIER_CACHE_MAX_SIZE),
+    ttl_seconds=settings_config.SUPPLIER_CACHE_TTL_SECONDS,
+    shared=load_backend(settings_config.SUPPLIER_CACHE_BACKEND),
+)
@@ -0,0 +1,168 @@
+import functools
+import inspect
+from collections.abc import Mapping
+from types import UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+# Name of the Response parameter added to endpoints that do not declare one
+_RESPONSE_PARAMETER = "fast_json_response"
+
+_fast_json_enabled = True
+
+
+def enable_fast_json(enabled: bool) -> None:
+    """
+    Switch FastJSONRoute endpoints between the fast path and FastAPI's own
+    response_model serialization
+
+    Args:
+        enabled (bool): Use the fast path
+    """
+    global _fast_json_enabled
+    _fast_json_enabled = enabled
+
+
+def _plain(annotation: Any, value: Any) -> Any:
+    # Rebuild `value` as plain lists/dicts following the schema's fields
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return _plain(_pick_union_member(get_args(annotation), value), value)
+    if origin in (list, tuple, set, frozenset):
+        (item_annotation,) = get_args(annotation)[:1] or (Any,)
+        return [_plain(item_annotation, item) for item in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if isinstance(value, BaseModel):
+            return value
+        if isinstance(value, Mapping):
+            return {
+                name: _plain(field.annotation, value.get(name, field.default))
+                for name, field in annotation.model_fields.items()
+            }
+        return {
+            name: _plain(field.annotation, getattr(value, name, field.default))
+            for name, field in annotation.model_fields.items()
+        }
+    return value
+
+
+def _pick_union_member(members: tuple, value: Any) -> Any:
+    for member in members:
+        if member is type(None):
+            continue
+        member_origin = get_origin(member)
+        if member_origin in (list, tuple, set, frozenset):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return member
+        elif isinstance(member, type) and isinstance(value, member):
+            return member
+    # ORM rows match no member by type; take the first model member
+    return next(
+        (
+            member
+            for member in members
+            if isinstance(member, type) and issubclass(member, BaseModel)
+        ),
+        Any,
+    )
+
+
+def dump_json(schema: Any, value: Any) -> bytes:
+    """
+    Serialize ORM rows (or dicts / models) as ``schema`` without validating
+
+    Values are read straight off the rows following the schema's fields and
+    encoded by pydantic-core. Rows were validated on their way into the
+    database, and re-validating them on the way out (EmailStr in particular)
+    is what dominates the cost of FastAPI's response_model path.
+
+    Args:
+        schema (Any): The response type, e.g. list[supplier_schema.Supplier]
+        value (Any): The object(s) to serialize
+
+    Returns:
+        bytes: The JSON body
+    """
+    return to_json(_plain(schema, value))
+
+
+def fast_json_endpoint(
+    endpoint: Callable, response_model: Any, status_code: int | None
+) -> Callable:
+    """
+    Wrap an async endpoint so its return value is serialized with dump_json
+
+    The wrapper receives the per-request Response that FastAPI hands to
+    endpoints and dependencies, and copies its status code and headers (ETags,
+    cookies) onto the response it builds, as FastAPI itself would.
+    """
+    signature = inspect.signature(endpoint)
+    response_name = next(
+        (
+            name
+            for name, parameter in signature.parameters.items()
+            if parameter.annotation is Response
+        ),
+        None,
+    )
+    parameters = list(signature.parameters.values())
+    if response_name is None:
+        parameters.append(
+            inspect.Parameter(
+                _RESPONSE_PARAMETER,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=Response,
+            )
+        )
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        if response_name is None:
+            response = kwargs.pop(_RESPONSE_PARAMETER)
+        else:
+            response = kwargs[response_name]
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response) or not _fast_json_enabled:
+            return result
+
+        fast_response = Response(
+            content=dump_json(response_model, result),
+            status_code=response.status_code or status_code or 200,
+            media_type="application/json",
+        )
+        fast_response.headers.raw.extend(response.headers.raw)
+        return fast_response
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    wrapper.__fast_json__ = True
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """
+    APIRoute serializing response_model endpoints through dump_json.
+
+    The response_model still drives the OpenAPI schema; only the runtime
+    serialization changes. Sync endpoints and routes without a
+    response_model are left to FastAPI.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        response_model = kwargs.get("response_model")
+        if (
+            response_model is not None
+            and not isinstance(response_model, DefaultPlaceholder)
+            and inspect.iscoroutinefunction(endpoint)
+            and not getattr(endpoint, "__fast_json__", False)
+        ):
+            endpoint = fast_json_endpoint(
+                endpoint, response_model, kwargs.get("status_code")
+            )
+        super().__init__(path, endpoint, **kwargs)
@@ -1,9 +1,12 @@
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.config.settings import settings_config
+from app.core.password_pool import password_pool
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -21,9 +24,53 @@ def create_access_token(data: dict, expires_delta: int = None):
     return encoded_jwt
 
 
+def create_refresh_token() -> str:
+    """Generate an opaque refresh token; only its hash is ever stored"""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> bytes:
+    # Refresh tokens are random, so a fast hash is enough (unlike passwords)
+    return hashlib.sha256(token.encode()).digest()
+
+
+def seal_successor_token(successor: str, token: str) -> bytes:
+    """
+    Encrypt the token a refresh token was rotated into, so that only a client
+    presenting the old token can recover it
+
+    The key stream is derived from the old token, which is never stored, and
+    a token has at most one successor, so a key stream is never reused.
+
+    Args:
+        successor (str): The token issued when ``token`` was rotated
+        token (str): The rotated token
+
+    Returns:
+        bytes: The sealed successor
+    """
+    data = successor.encode()
+    key_stream = hashlib.shake_256(b"successor:" + token.encode()).digest(len(data))
+    return bytes(a ^ b for a, b in zip(data, key_stream))
+
+
+def open_successor_token(sealed: bytes, token: str) -> str:
+    """Recover a successor sealed by seal_successor_token with the old token"""
+    key_stream = hashlib.shake_256(b"successor:" + token.encode()).digest(len(sealed))
+    return bytes(a ^ b for a, b in zip(sealed, key_stream)).decode()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
@@ -0,0 +1,203 @@
+import heapq
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Bind parameter markers of the drivers in use: $1 (asyncpg), %(name)s
+# (psycopg2), :name and ? (sqlite)
+_PLACEHOLDER = re.compile(r"\$\d+(?:::\w+(?:\[\])?)?|%\(\w+\)s|(?<!:):\w+|\?")
+# Expanded IN lists and multi-row VALUES collapse to a single group
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_VALUES_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a SQL statement so executions differing only in their bound
+    values, or in the length of an IN / VALUES list, compare equal
+
+    Args:
+        statement (str): The SQL sent to the driver
+
+    Returns:
+        str: The statement with parameters replaced by "?"
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _VALUES_LIST.sub("(?)", shape)
+
+
+class QueryProfile:
+    """Statements run while handling one request"""
+
+    def __init__(self, top_n: int):
+        self.top_n = top_n
+        self.count = 0
+        self.total_seconds = 0.0
+        # Min-heap of (duration, sequence, statement) holding the top_n slowest
+        self.slowest: list[tuple[float, int, str]] = []
+        self.shapes: dict[str, int] = {}
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_seconds += duration
+        shape = statement_shape(statement)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+        entry = (duration, self.count, shape)
+        if len(self.slowest) < self.top_n:
+            heapq.heappush(self.slowest, entry)
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def slowest_statements(self) -> list[tuple[float, str]]:
+        return [
+            (duration, shape)
+            for duration, _, shape in sorted(self.slowest, reverse=True)
+        ]
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes run more than ``threshold`` times, most first"""
+        repeated = [
+            (shape, count) for shape, count in self.shapes.items() if count > threshold
+        ]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar(
+    "sql_profile", default=None
+)
+
+
+def instrument_engine(name: str, engine: Engine, slow_query_ms: float) -> None:
+    """
+    Time every statement run on ``engine``
+
+    Durations are added to the current request's QueryProfile, and
+    statements slower than ``slow_query_ms`` are logged as JSON.
+
+    Args:
+        name (str): The engine label used in the slow-query log
+        engine (Engine): A sync engine, or ``AsyncEngine.sync_engine``
+        slow_query_ms (float): Slow-query log threshold in milliseconds
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("sql_profiler_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["sql_profiler_started"].pop()
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, duration)
+        if duration * 1000 >= slow_query_ms:
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_query",
+                        "engine": name,
+                        "duration_ms": round(duration * 1000, 3),
+                        "executemany": executemany,
+                        "statement": statement_shape(statement),
+                    }
+                )
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(context):
+        # A failed statement never reaches after_cursor_execute
+        started = context.connection.info.get("sql_profiler_started")
+        if started:
+            started.pop()
+
+
+class SQLProfilerMiddleware:
+    """
+    ASGI middleware profiling the SQL run by each request.
+
+    Adds a Server-Timing header with the statement count, total database
+    time and the durations of the slowest statements, visible in the
+    browser's network panel. The header reaches every client, so it carries
+    no statement text: the statements of requests whose total database time
+    exceeds ``slow_query_ms``, and statement shapes repeated more than
+    ``repeat_threshold`` times in one request (the N+1 pattern), are logged
+    instead.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_query_ms: float = 200.0,
+        top_n: int = 3,
+        repeat_threshold: int = 10,
+    ):
+        self.app = app
+        self.slow_query_ms = slow_query_ms
+        self.top_n = top_n
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(self.top_n)
+        token = _current_profile.set(profile)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", self.server_timing(profile))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            self.log_request(scope, profile)
+
+    def server_timing(self, profile: QueryProfile) -> str:
+        total_ms = profile.total_seconds * 1000
+        metrics = [f'db;dur={total_ms:.2f};desc="{profile.count} statements"']
+        for index, (duration, _) in enumerate(profile.slowest_statements(), 1):
+            metrics.append(f"db-{index};dur={duration * 1000:.2f}")
+        for _, count in profile.repeated(self.repeat_threshold)[:1]:
+            metrics.append(f'db-repeated;desc="{count}x, see logs"')
+        return ", ".join(metrics)
+
+    def log_request(self, scope: Scope, profile: QueryProfile) -> None:
+        repeated = profile.repeated(self.repeat_threshold)
+        if profile.total_seconds * 1000 < self.slow_query_ms and not repeated:
+            return
+        route = scope.get("route")
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "slow_request_sql",
+                    "method": scope["method"],
+                    "route": getattr(route, "path", None) or scope["path"],
+                    "statements": profile.count,
+                    "db_ms": round(profile.total_seconds * 1000, 3),
+                    "slowest": [
+                        {"duration_ms": round(duration * 1000, 3), "statement": shape}
+                        for duration, shape in profile.slowest_statements()
+                    ],
+                    "repeated": [
+                        {"count": count, "statement": shape}
+                        for shape, count in repeated
+                    ],
+                }
+            )
+        )
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from app.config.settings import settings_config
+from app.schemas.user import User
+
+
+class UserCache:
+    """
+    Bounded LRU cache of authenticated users keyed by token subject (email).
+
+    Entries expire after ``ttl_seconds`` so changes made by other workers are
+    picked up eventually; changes made through UserService invalidate the
+    entry immediately.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, subject: str) -> User | None:
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return user
+
+    def set(self, subject: str, user: User) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            stale = [
+                subject
+                for subject, (_, user) in self._entries.items()
+                if user.id == user_id
+            ]
+            for subject in stale:
+                del self._entries[subject]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+user_cache = UserCache(
+    max_size=settings_config.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings_config.USER_CACHE_TTL_SECONDS,
+)
@@ -1,14 +1,223 @@
-from sqlalchemy import create_engine
+import time
+
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.config.settings import settings_config
+from app.core.metrics import DB_POOL_TIMEOUTS_TOTAL, InstrumentedAsyncQueuePool
+from app.db.replicas import ReplicaRouter, parse_database_urls
+from app.exceptions.database import DatabasePoolExhaustedException
 
 SQLALCHEMY_DATABASE_URL = settings_config.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+# Async drivers used when deriving the async URL from DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """
+    Derive the async driver URL from a sync database URL
+
+    Args:
+        url (str): The sync database URL (e.g. postgresql://...)
+
+    Returns:
+        str: The same URL using the matching async driver
+    """
+    parsed = make_url(url.replace("postgres://", "postgresql://", 1))
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+SQLALCHEMY_ASYNC_DATABASE_URL = get_async_database_url(SQLALCHEMY_DATABASE_URL)
+
+
+class FailFastPoolMixin:
+    """
+    Turn a pool checkout timeout into a 503 instead of a generic error
+
+    With a short DB_POOL_TIMEOUT_SECONDS, requests arriving while every
+    connection is busy are shed quickly rather than queuing behind the pool.
+    """
+
+    def _do_get(self):
+        try:
+            return super()._do_get()
+        except PoolTimeoutError as e:
+            DB_POOL_TIMEOUTS_TOTAL.inc()
+            raise DatabasePoolExhaustedException() from e
+
+
+class FailFastQueuePool(FailFastPoolMixin, QueuePool):
+    pass
+
+
+class FailFastAsyncQueuePool(FailFastPoolMixin, InstrumentedAsyncQueuePool):
+    pass
+
+
+def get_statement_timeout_connect_args(url: str, timeout_ms: int) -> dict:
+    """
+    Driver connect arguments setting statement_timeout on every new connection
+
+    Args:
+        url (str): The database URL
+        timeout_ms (int): The timeout in milliseconds, 0 to leave it unset
+
+    Returns:
+        dict: connect_args for the engine (empty when not applicable)
+    """
+    parsed = make_url(url)
+    if timeout_ms <= 0 or parsed.get_backend_name() != "postgresql":
+        return {}
+    if parsed.get_driver_name() == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(timeout_ms)}}
+    return {"options": f"-c statement_timeout={timeout_ms}"}
+
+
+def get_engine_options(url: str, is_async: bool = False) -> dict:
+    """
+    Engine keyword arguments for the given URL, built from the DB_* settings
+
+    SQLite keeps SQLAlchemy's default pool for its URL type, so only
+    pre-ping applies there.
+
+    Args:
+        url (str): The database URL
+        is_async (bool): Whether the options are for create_async_engine
+
+    Returns:
+        dict: Keyword arguments for create_engine / create_async_engine
+    """
+    options = {"pool_pre_ping": settings_config.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=FailFastAsyncQueuePool if is_async else FailFastQueuePool,
+        pool_size=settings_config.DB_POOL_SIZE,
+        max_overflow=settings_config.DB_MAX_OVERFLOW,
+        pool_timeout=settings_config.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings_config.DB_POOL_RECYCLE_SECONDS,
+        connect_args=get_statement_timeout_connect_args(
+            url, settings_config.DB_STATEMENT_TIMEOUT_MS
+        ),
+    )
+    return options
+
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, **get_engine_options(SQLALCHEMY_DATABASE_URL)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    SQLALCHEMY_ASYNC_DATABASE_URL,
+    **get_engine_options(SQLALCHEMY_ASYNC_DATABASE_URL, is_async=True),
+)
+
+replica_engines = [
+    create_async_engine(url, **get_engine_options(url, is_async=True))
+    for url in map(
+        get_async_database_url,
+        parse_database_urls(settings_config.DATABASE_REPLICA_URLS),
+    )
+]
+replica_router = (
+    ReplicaRouter(replica_engines, settings_config.REPLICA_RETRY_SECONDS)
+    if replica_engines
+    else None
+)
+
+# bind_arguments marking a read that may be served by a replica
+READ_REPLICA = {"replica": True}
+
+# Cookie holding the time until which a client's reads stay on the primary
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+
+class RoutingSession(Session):
+    """
+    Session sending opted-in reads to a replica and everything else to the primary
+
+    Reads opt in with ``bind_arguments=READ_REPLICA``. Once the session runs
+    an INSERT/UPDATE/DELETE, or when it is opened with ``info["primary_only"]``,
+    every statement stays on the primary so callers read their own writes.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, replica=False, **kw):
+        if (
+            replica
+            and replica_router is not None
+            and not self.info.get("primary_only")
+        ):
+            replica_engine = replica_router.choose()
+            if replica_engine is not None:
+                return replica_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def stick_to_primary_after_write(orm_execute_state):
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    session = orm_execute_state.session
+    session.info["primary_only"] = True
+
+    # Keep the client on the primary until replicas have caught up
+    response = session.info.get("response")
+    if response is not None:
+        stickiness = settings_config.REPLICA_STICKINESS_SECONDS
+        response.set_cookie(
+            key=PRIMARY_STICKY_COOKIE,
+            value=str(int(time.time() + stickiness)),
+            max_age=stickiness,
+            httponly=True,
+            secure=True,
+            samesite="none",
+            path="/",
+        )
+
+
+def reads_pinned_to_primary(request: Request) -> bool:
+    """
+    Whether the client wrote recently enough that replicas may still lag
+
+    Args:
+        request (Request): The incoming request
+
+    Returns:
+        bool: True while the client's stickiness cookie has not expired
+    """
+    try:
+        return int(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+)
+
 Base = declarative_base()
 
 
@@ -18,3 +227,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request, response: Response):
+    async with AsyncSessionLocal() as db:
+        if replica_router is not None:
+            db.info["response"] = response
+            db.info["primary_only"] = reads_pinned_to_primary(request)
+        yield db
@@ -1,10 +1,34 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Sequence,
+    String,
+    event,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from .database import Base
 
+# Columns matched by supplier search, each backed by a pg_trgm GIN index
+SUPPLIER_SEARCH_COLUMNS = ("name", "email", "phone", "address")
+
+# Every supplier insert, update and delete draws its change feed position
+# from this sequence (Postgres only; SQLite derives it from the tables). The
+# feed orders changes by (change_txid, change_seq): the writing transaction,
+# then the sequence within it
+supplier_change_seq = Sequence("supplier_change_seq", metadata=Base.metadata)
+
 
 class User(Base):
     __tablename__ = "users"
@@ -18,9 +42,309 @@ class User(Base):
 
 class Supplier(Base):
     __tablename__ = "suppliers"
+    __table_args__ = (
+        Index("ix_suppliers_name_id", "name", "id"),
+        Index("ix_suppliers_change_position", "change_txid", "change_seq"),
+        *(
+            Index(
+                f"ix_suppliers_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in SUPPLIER_SEARCH_COLUMNS
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, index=True)
-    email = Column(String, index=True)
+    email = Column(String, unique=True, index=True)
     address = Column(String)
-    phone = Column(String)
+    phone = Column(String, unique=True, index=True)
+    # Bumped by every update; backs the supplier ETags
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Position of the last write in the change feed, set by a trigger
+    change_txid = Column(
+        BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    change_seq = Column(
+        BigInteger, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    # NULL for suppliers created before the column existed
+    created_at = Column(
+        DateTime(timezone=True), index=True, server_default=func.now()
+    )
+
+
+class SupplierCount(Base):
+    """
+    Supplier counters kept current by triggers on suppliers, in the writing
+    transaction: bucket "*" is the total, "domain:<domain>" the suppliers per
+    email domain and "day:<YYYY-MM-DD>" the suppliers added that day (UTC)
+    """
+
+    __tablename__ = "supplier_counts"
+
+    bucket = Column(String, primary_key=True)
+    supplier_count = Column(BigInteger, nullable=False, default=0)
+
+
+class SupplierTombstone(Base):
+    """
+    Left behind by a deleted supplier so the change feed can report it; kept
+    for SUPPLIER_TOMBSTONE_RETENTION_DAYS
+    """
+
+    __tablename__ = "supplier_tombstones"
+    __table_args__ = (
+        Index("ix_supplier_tombstones_change_position", "change_txid", "change_seq"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    change_txid = Column(BigInteger, nullable=False, server_default="0")
+    change_seq = Column(BigInteger, nullable=False)
+    deleted_at = Column(
+        DateTime(timezone=True), nullable=False, index=True, server_default=func.now()
+    )
+
+
+class RefreshToken(Base):
+    """
+    One issued refresh token. Only the SHA-256 of the token is stored; every
+    rotation of a login shares its ``family_id`` so a reused token can revoke
+    the whole chain. A rotated token keeps its successor, sealed with the
+    token itself, for the reuse grace window.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked = Column(Boolean, nullable=False, default=False, server_default="false")
+    rotated_at = Column(DateTime(timezone=True), nullable=True)
+    successor = Column(LargeBinary, nullable=True)
+
+
+# The trigram indexes need pg_trgm when tables are created without Alembic
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+# Keep in sync with alembic revision d84c2a6e1f39, which installs the same
+# trigger on migrated databases
+SUPPLIER_CHANGE_TRIGGER_POSTGRES = (
+    """
+    CREATE OR REPLACE FUNCTION supplier_track_change() RETURNS trigger AS $$
+    BEGIN
+        -- No lock between writers: the feed only returns changes of
+        -- transactions older than the reader's snapshot xmin, which have all
+        -- finished, so a change can never commit behind a token
+        IF TG_OP = 'DELETE' THEN
+            INSERT INTO supplier_tombstones (id, change_txid, change_seq)
+            VALUES (OLD.id, txid_current(), nextval('supplier_change_seq'))
+            ON CONFLICT (id) DO UPDATE
+            SET change_txid = EXCLUDED.change_txid,
+                change_seq = EXCLUDED.change_seq,
+                deleted_at = now();
+            RETURN OLD;
+        END IF;
+        NEW.change_txid := txid_current();
+        NEW.change_seq := nextval('supplier_change_seq');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER suppliers_track_change
+    BEFORE INSERT OR UPDATE OR DELETE ON suppliers
+    FOR EACH ROW EXECUTE FUNCTION supplier_track_change()
+    """,
+)
+
+# SQLite serializes writers, so every change is at change_txid 0 and the
+# next position is one past the highest in use. That only grows because
+# pruning always keeps the newest tombstone
+_SQLITE_NEXT_CHANGE_SEQ = """(
+    SELECT coalesce(max(seq), 0) + 1 FROM (
+        SELECT max(change_seq) AS seq FROM suppliers
+        UNION ALL SELECT max(change_seq) FROM supplier_tombstones
+    )
+)"""
+
+SUPPLIER_CHANGE_TRIGGER_SQLITE = (
+    f"""
+    CREATE TRIGGER suppliers_track_insert AFTER INSERT ON suppliers
+    BEGIN
+        UPDATE suppliers
+        SET change_txid = 0, change_seq = {_SQLITE_NEXT_CHANGE_SEQ}
+        WHERE id = NEW.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER suppliers_track_update
+    AFTER UPDATE OF name, email, address, phone, version ON suppliers
+    BEGIN
+        UPDATE suppliers
+        SET change_txid = 0, change_seq = {_SQLITE_NEXT_CHANGE_SEQ}
+        WHERE id = NEW.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER suppliers_track_delete AFTER DELETE ON suppliers
+    BEGIN
+        INSERT OR REPLACE INTO supplier_tombstones (id, change_txid, change_seq)
+        VALUES (OLD.id, 0, {_SQLITE_NEXT_CHANGE_SEQ});
+    END
+    """,
+)
+
+# Keep in sync with alembic revision 5c2d9e7a4f16. Statement-level triggers
+# with transition tables, so an import or bulk write updates each counter
+# once per statement instead of once per row
+SUPPLIER_COUNT_TRIGGER_POSTGRES = (
+    """
+    CREATE OR REPLACE FUNCTION supplier_update_counts() RETURNS trigger AS $$
+    BEGIN
+        -- Each branch only reads the transition tables its event provides
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO supplier_counts (bucket, supplier_count)
+            SELECT bucket, sum(delta) FROM (
+                SELECT '*' AS bucket, 1 AS delta FROM new_rows
+                UNION ALL
+                SELECT 'day:' || to_char(now() AT TIME ZONE 'UTC', 'YYYY-MM-DD'), 1
+                FROM new_rows
+                UNION ALL
+                SELECT 'domain:' || lower(split_part(email, '@', 2)), 1
+                FROM new_rows WHERE email IS NOT NULL
+            ) AS deltas
+            GROUP BY bucket
+            ON CONFLICT (bucket) DO UPDATE
+            SET supplier_count = supplier_counts.supplier_count
+                + EXCLUDED.supplier_count;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO supplier_counts (bucket, supplier_count)
+            SELECT bucket, sum(delta) FROM (
+                SELECT '*' AS bucket, -1 AS delta FROM old_rows
+                UNION ALL
+                SELECT 'domain:' || lower(split_part(email, '@', 2)), -1
+                FROM old_rows WHERE email IS NOT NULL
+            ) AS deltas
+            GROUP BY bucket
+            ON CONFLICT (bucket) DO UPDATE
+            SET supplier_count = supplier_counts.supplier_count
+                + EXCLUDED.supplier_count;
+        ELSE
+            -- Only email changes move counts; other updates net to zero
+            INSERT INTO supplier_counts (bucket, supplier_count)
+            SELECT bucket, sum(delta) FROM (
+                SELECT 'domain:' || lower(split_part(email, '@', 2)) AS bucket,
+                    -1 AS delta
+                FROM old_rows WHERE email IS NOT NULL
+                UNION ALL
+                SELECT 'domain:' || lower(split_part(email, '@', 2)), 1
+                FROM new_rows WHERE email IS NOT NULL
+            ) AS deltas
+            GROUP BY bucket
+            HAVING sum(delta) <> 0
+            ON CONFLICT (bucket) DO UPDATE
+            SET supplier_count = supplier_counts.supplier_count
+                + EXCLUDED.supplier_count;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER suppliers_count_insert AFTER INSERT ON suppliers
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+    """,
+    """
+    CREATE TRIGGER suppliers_count_update AFTER UPDATE ON suppliers
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+    """,
+    """
+    CREATE TRIGGER suppliers_count_delete AFTER DELETE ON suppliers
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION supplier_update_counts()
+    """,
+)
+
+# Like the Postgres triggers, suppliers without an email count towards no
+# domain. SQLite needs the WHERE on the outer SELECT to parse ON CONFLICT
+SUPPLIER_COUNT_TRIGGER_SQLITE = (
+    """
+    CREATE TRIGGER suppliers_count_insert AFTER INSERT ON suppliers
+    BEGIN
+        INSERT INTO supplier_counts (bucket, supplier_count)
+        SELECT bucket, delta FROM (
+            SELECT '*' AS bucket, 1 AS delta
+            UNION ALL
+            SELECT 'day:' || date('now'), 1
+            UNION ALL
+            SELECT 'domain:' || lower(substr(NEW.email, instr(NEW.email, '@') + 1)), 1
+            WHERE NEW.email IS NOT NULL
+        ) WHERE true
+        ON CONFLICT (bucket) DO UPDATE
+        SET supplier_count = supplier_count + excluded.supplier_count;
+    END
+    """,
+    """
+    CREATE TRIGGER suppliers_count_update AFTER UPDATE OF email ON suppliers
+    BEGIN
+        INSERT INTO supplier_counts (bucket, supplier_count)
+        SELECT bucket, delta FROM (
+            SELECT
+                'domain:' || lower(substr(OLD.email, instr(OLD.email, '@') + 1))
+                    AS bucket,
+                -1 AS delta
+            WHERE OLD.email IS NOT NULL
+            UNION ALL
+            SELECT 'domain:' || lower(substr(NEW.email, instr(NEW.email, '@') + 1)), 1
+            WHERE NEW.email IS NOT NULL
+        ) WHERE true
+        ON CONFLICT (bucket) DO UPDATE
+        SET supplier_count = supplier_count + excluded.supplier_count;
+    END
+    """,
+    """
+    CREATE TRIGGER suppliers_count_delete AFTER DELETE ON suppliers
+    BEGIN
+        INSERT INTO supplier_counts (bucket, supplier_count)
+        SELECT bucket, delta FROM (
+            SELECT '*' AS bucket, -1 AS delta
+            UNION ALL
+            SELECT 'domain:' || lower(substr(OLD.email, instr(OLD.email, '@') + 1)), -1
+            WHERE OLD.email IS NOT NULL
+        ) WHERE true
+        ON CONFLICT (bucket) DO UPDATE
+        SET supplier_count = supplier_count + excluded.supplier_count;
+    END
+    """,
+)
+
+# Installed only when create_all actually creates the suppliers table
+for statement in SUPPLIER_CHANGE_TRIGGER_POSTGRES + SUPPLIER_COUNT_TRIGGER_POSTGRES:
+    event.listen(
+        Supplier.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+for statement in SUPPLIER_CHANGE_TRIGGER_SQLITE + SUPPLIER_COUNT_TRIGGER_SQLITE:
+    event.listen(
+        Supplier.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
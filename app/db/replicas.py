@@ -0,0 +1,86 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def parse_database_urls(value: str) -> list[str]:
+    """
+    Split a comma-separated list of database URLs
+
+    Args:
+        value (str): e.g. "postgresql://replica-1/db,postgresql://replica-2/db"
+
+    Returns:
+        list[str]: The non-empty URLs in order
+    """
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+class ReplicaRouter:
+    """
+    Round-robin choice among read replicas with passive health checks.
+
+    A replica is marked down when opening a connection to it fails or a
+    statement on it hits a disconnect, and is skipped for ``retry_seconds``;
+    after that the next request routed to it acts as the probe. When every
+    replica is down, ``choose()`` returns None and reads use the primary.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], retry_seconds: float):
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._down_until = [0.0] * len(engines)
+        self._next = 0
+        self._lock = threading.Lock()
+        self.routed = 0
+        self.fallbacks = 0
+        self.failures = 0
+        for index, engine in enumerate(engines):
+            self._watch(index, engine.sync_engine)
+
+    def choose(self) -> Engine | None:
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = self._next
+                self._next = (self._next + 1) % len(self.engines)
+                if self._down_until[index] <= now:
+                    self.routed += 1
+                    return self.engines[index].sync_engine
+            self.fallbacks += 1
+        return None
+
+    def mark_down(self, index: int) -> None:
+        with self._lock:
+            self.failures += 1
+            self._down_until[index] = time.monotonic() + self.retry_seconds
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": len(self.engines),
+                "healthy": sum(until <= now for until in self._down_until),
+                "routed": self.routed,
+                "fallbacks": self.fallbacks,
+                "failures": self.failures,
+            }
+
+    def _watch(self, index: int, engine: Engine) -> None:
+        @event.listens_for(engine, "do_connect")
+        def connect(dialect, connection_record, cargs, cparams):
+            # Connect errors are not always DBAPI errors (asyncpg raises
+            # OSError), so they are caught here rather than in handle_error
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except Exception:
+                self.mark_down(index)
+                raise
+
+        @event.listens_for(engine, "handle_error")
+        def disconnected(context):
+            if context.is_disconnect:
+                self.mark_down(index)
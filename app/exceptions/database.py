@@ -7,3 +7,12 @@ class DatabaseOperationException(HTTPException):
             status_code=500,
             detail=f"Database operation failed: {operation}. Details: {details}",
         )
+
+
+class DatabasePoolExhaustedException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            detail="Database is busy, try again shortly",
+            headers={"Retry-After": "1"},
+        )
@@ -0,0 +1,13 @@
+from fastapi import HTTPException
+
+
+class ProfilerAlreadyRunningException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=409, detail="A CPU profiling session is already running"
+        )
+
+
+class ProfilerNotRunningException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=409, detail="No CPU profiling session is running")
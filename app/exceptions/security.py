@@ -0,0 +1,24 @@
+from fastapi import HTTPException
+
+
+class PasswordWorkerPoolFullException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            detail="Too many concurrent authentication requests, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+class InvalidRefreshTokenException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=401,
+            detail="Invalid or expired refresh token!",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class AdminRequiredException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=403, detail="Administrator access required")
@@ -14,3 +14,39 @@ class SupplierAlreadyExistsException(HTTPException):
             status_code=400,
             detail=f"Supplier with {identifier_type} '{value}' already exists",
         )
+
+
+class InvalidSupplierCursorException(HTTPException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=400, detail=f"Invalid pagination cursor '{cursor}'"
+        )
+
+
+class InvalidSupplierChangeTokenException(HTTPException):
+    def __init__(self, token: str):
+        super().__init__(status_code=400, detail=f"Invalid change token '{token}'")
+
+
+class SupplierChangeTokenExpiredException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=410,
+            detail="Change token has expired, sync again from the beginning",
+        )
+
+
+class SupplierVersionMismatchException(HTTPException):
+    def __init__(self, supplier_id: int):
+        super().__init__(
+            status_code=412,
+            detail=f"Supplier with id {supplier_id} has been modified",
+        )
+
+
+class SupplierBatchTooLargeException(HTTPException):
+    def __init__(self, size: int, max_size: int):
+        super().__init__(
+            status_code=413,
+            detail=f"Batch of {size} suppliers exceeds the limit of {max_size}",
+        )
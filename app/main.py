@@ -1,23 +1,44 @@
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.routing import APIRouter
 
-from app.api.routes import authentication, suppliers, users
+from app.api.routes import authentication, profiler, suppliers, users
 from app.config.settings import settings_config
+from app.core import metrics
+from app.core.auth import require_metrics_access
+from app.core.compression import CompressionMiddleware
+from app.core.cpu_profiler import CPUProfilerMiddleware, cpu_profiler
+from app.core.events import supplier_events
+from app.core.maintenance import tombstone_pruner
+from app.core.password_pool import password_pool
+from app.core.responses import enable_fast_json
+from app.core.response_cache import supplier_cache
+from app.core.single_flight import supplier_flight
+from app.core.sql_profiler import SQLProfilerMiddleware, instrument_engine
+from app.core.user_cache import user_cache
 from app.db import db_models
-from app.db.database import engine
+from app.db.database import async_engine, engine, replica_engines, replica_router
 
 db_models.Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
 
+# Ends open supplier WebSockets and stops the broadcast listener
+app.add_event_handler("shutdown", supplier_events.close)
+
+# Drops supplier change feed tombstones past their retention
+app.add_event_handler("startup", tombstone_pruner.start)
+app.add_event_handler("shutdown", tombstone_pruner.stop)
+
+# Serialize response_model routes in pydantic-core instead of through
+# FastAPI's validate / dump / json.dumps path (see app.core.responses)
+enable_fast_json(settings_config.FAST_JSON_RESPONSES)
+
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        settings_config.FRONTEND_URL,
-        "http://localhost:3000",
-    ],  # List of origins that are allowed to make requests to this API. Use "*" to allow all origins.
+    allow_origins=settings_config.ALLOWED_ORIGINS,  # List of origins that are allowed to make requests to this API. Use "*" to allow all origins.
     allow_credentials=True,
     allow_methods=[
         "*"
@@ -25,6 +46,100 @@ app.add_middleware(
     allow_headers=["*"],  # List of HTTP headers allowed. Use "*" to allow all headers.
 )
 
+if settings_config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings_config.COMPRESSION_MINIMUM_SIZE,
+        level=settings_config.COMPRESSION_LEVEL,
+        content_types=[
+            content_type.strip()
+            for content_type in settings_config.COMPRESSION_CONTENT_TYPES.split(",")
+        ],
+        encodings=[
+            encoding.strip()
+            for encoding in settings_config.COMPRESSION_ENCODINGS.split(",")
+        ],
+    )
+
+if settings_config.SQL_PROFILING_ENABLED:
+    app.add_middleware(
+        SQLProfilerMiddleware,
+        slow_query_ms=settings_config.SQL_SLOW_QUERY_MS,
+        top_n=settings_config.SQL_PROFILE_TOP_STATEMENTS,
+        repeat_threshold=settings_config.SQL_REPEATED_STATEMENT_THRESHOLD,
+    )
+    for name, profiled_engine in [
+        ("primary", engine),
+        ("primary_async", async_engine.sync_engine),
+        *(
+            (f"replica_{index}", replica_engine.sync_engine)
+            for index, replica_engine in enumerate(replica_engines)
+        ),
+    ]:
+        instrument_engine(name, profiled_engine, settings_config.SQL_SLOW_QUERY_MS)
+
+# Admin-started CPU profiling sessions (see app.core.cpu_profiler)
+if settings_config.CPU_PROFILING_ENABLED:
+    app.add_middleware(CPUProfilerMiddleware, profiler=cpu_profiler)
+
+if settings_config.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.track_engine("primary", async_engine.sync_engine)
+    for index, replica_engine in enumerate(replica_engines):
+        metrics.track_engine(f"replica_{index}", replica_engine.sync_engine)
+    if replica_router is not None:
+        metrics.registry.register_collector(
+            metrics.stats_collector(
+                "db_replicas", replica_router.stats, "Read replica routing"
+            )
+        )
+    metrics.registry.register_collector(
+        metrics.stats_collector(
+            "user_cache", user_cache.stats, "Authenticated user cache"
+        )
+    )
+    metrics.registry.register_collector(
+        metrics.stats_collector(
+            "password_pool", password_pool.stats, "bcrypt worker pool"
+        )
+    )
+    metrics.registry.register_collector(
+        metrics.stats_collector(
+            "supplier_cache", supplier_cache.stats, "Supplier response cache"
+        )
+    )
+    metrics.registry.register_collector(
+        metrics.stats_collector(
+            "supplier_events", supplier_events.stats, "Supplier WebSocket events"
+        )
+    )
+    metrics.registry.register_collector(
+        metrics.stats_collector(
+            "supplier_single_flight",
+            supplier_flight.stats,
+            "Coalesced concurrent supplier reads",
+        )
+    )
+    if settings_config.CPU_PROFILING_ENABLED:
+        metrics.registry.register_collector(
+            metrics.stats_collector(
+                "cpu_profiler", cpu_profiler.stats, "Sampling CPU profiler"
+            )
+        )
+
+    # Scraped with the METRICS_TOKEN bearer token; administrators can also
+    # read it with their session
+    @app.get(
+        "/metrics",
+        include_in_schema=False,
+        dependencies=[Depends(require_metrics_access)],
+    )
+    def get_metrics():
+        return PlainTextResponse(
+            metrics.registry.render(), media_type="text/plain; version=0.0.4"
+        )
+
+
 # Create a main API router
 main_router = APIRouter()
 
@@ -38,6 +153,10 @@ def root():
 main_router.include_router(suppliers.routes, prefix="/suppliers", tags=["suppliers"])
 main_router.include_router(users.routes, prefix="/user", tags=["user"])
 main_router.include_router(authentication.routes, prefix="/auth", tags=["auth"])
+if settings_config.CPU_PROFILING_ENABLED:
+    main_router.include_router(
+        profiler.routes, prefix="/admin/profiler", tags=["admin"]
+    )
 
 # Include the main router under the /api path
 app.include_router(main_router, prefix="/api")
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CPUProfileStart(BaseModel):
+    seconds: float = Field(default=30.0, gt=0)
+    # Fraction of requests to profile; omit to profile the whole process
+    sample_rate: Optional[float] = Field(default=None, gt=0, le=1)
+
+
+class CPUProfileSession(BaseModel):
+    running: bool
+    mode: Literal["process", "requests"]
+    sample_rate: Optional[float] = None
+    started_at: datetime
+    ends_at: datetime
+    samples: int
+    output_file: str
+
+
+class CPUProfilerStatus(BaseModel):
+    session: Optional[CPUProfileSession] = None
+    profiles: list[str]
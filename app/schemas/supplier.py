@@ -1,7 +1,8 @@
-from typing import Optional
+from datetime import date
+from typing import Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 
 class SupplierBase(BaseModel):
@@ -24,6 +25,95 @@ class SupplierUpdate(BaseModel):
 
 class Supplier(SupplierBase):
     id: UUID
+    version: int
 
     class Config:
         from_attributes = True
+
+
+class SupplierPage(BaseModel):
+    items: list[Supplier]
+    next_cursor: Optional[str] = None
+
+
+class SupplierChanges(BaseModel):
+    changed: list[Supplier]
+    deleted: list[UUID]
+    next_token: str
+    has_more: bool
+
+
+class SupplierDomainCount(BaseModel):
+    domain: str
+    count: int
+
+
+class SupplierDailyCount(BaseModel):
+    day: date
+    count: int
+
+
+class SupplierStats(BaseModel):
+    total: int
+    # From the planner statistics (pg_class.reltuples); only when requested
+    approximate_total: Optional[int] = None
+    top_domains: list[SupplierDomainCount]
+    added_per_day: list[SupplierDailyCount]
+    recently_added: list[Supplier]
+
+
+class SupplierEvent(BaseModel):
+    type: Literal["created", "updated", "deleted"]
+    id: UUID
+    # Present when the write returned the row; bulk writes send IDs only
+    supplier: Optional[Supplier] = None
+
+
+class SupplierImportError(BaseModel):
+    row: int
+    error: str
+
+
+class SupplierImportResult(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    errors: list[SupplierImportError]
+    elapsed_seconds: float
+    rows_per_second: float
+    # Set when a chunk failed to commit; earlier chunks remain imported
+    aborted: bool = False
+    aborted_reason: Optional[str] = None
+
+
+class SupplierBatchGetRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1)
+
+
+class SupplierBatchGetResult(BaseModel):
+    items: list[Supplier]
+    missing: list[UUID]
+
+
+class SupplierBulkUpdateItem(SupplierUpdate):
+    id: UUID
+
+
+class SupplierBulkUpdateRequest(BaseModel):
+    items: list[SupplierBulkUpdateItem] = Field(min_length=1)
+
+
+class SupplierBulkDeleteRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1)
+
+
+class SupplierBulkItemResult(BaseModel):
+    id: UUID
+    status: Literal["updated", "unchanged", "deleted", "not_found", "conflict"]
+    error: Optional[str] = None
+
+
+class SupplierBulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[SupplierBulkItemResult]
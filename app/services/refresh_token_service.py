@@ -0,0 +1,251 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import settings_config
+from app.core.security import (
+    create_refresh_token,
+    hash_refresh_token,
+    open_successor_token,
+    seal_successor_token,
+)
+from app.db import db_models
+from app.exceptions.database import (
+    DatabaseOperationException,
+    DatabasePoolExhaustedException,
+)
+from app.exceptions.security import InvalidRefreshTokenException
+from app.schemas import user as user_schema
+
+
+class AsyncRefreshTokenService:
+    @staticmethod
+    async def issue(
+        db: AsyncSession, user_id: UUID, family_id: UUID | None = None
+    ) -> str:
+        """
+        Store a new refresh token for a user and commit
+
+        A login starts a new token family; expired and revoked tokens left
+        over from the user's earlier logins are deleted in the same
+        transaction (except tokens still in their reuse grace window), so the
+        table only holds live tokens plus recent history.
+
+        Args:
+            db (AsyncSession): The async database session
+            user_id (UUID): The ID of the user the token is issued to
+            family_id (UUID | None): The family of the token being rotated, or
+                None for a new login
+
+        Returns:
+            str: The refresh token, to be handed to the client once
+
+        Raises:
+            DatabaseOperationException: If the database operation fails
+        """
+        token = create_refresh_token()
+        now = datetime.now(timezone.utc)
+        RefreshToken = db_models.RefreshToken
+        try:
+            if family_id is None:
+                family_id = uuid.uuid4()
+                grace = timedelta(
+                    seconds=settings_config.REFRESH_TOKEN_REUSE_GRACE_SECONDS
+                )
+                await db.execute(
+                    delete(RefreshToken).where(
+                        RefreshToken.user_id == user_id,
+                        or_(
+                            RefreshToken.expires_at <= now,
+                            and_(
+                                RefreshToken.revoked,
+                                or_(
+                                    RefreshToken.rotated_at.is_(None),
+                                    RefreshToken.rotated_at <= now - grace,
+                                ),
+                            ),
+                        ),
+                    )
+                )
+            db.add(
+                RefreshToken(
+                    token_hash=hash_refresh_token(token),
+                    user_id=user_id,
+                    family_id=family_id,
+                    expires_at=now
+                    + timedelta(days=settings_config.REFRESH_TOKEN_EXPIRE_DAYS),
+                )
+            )
+            await db.commit()
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "issue_refresh_token", f"Unexpected error: {str(e)}"
+            )
+        return token
+
+    @staticmethod
+    async def rotate(db: AsyncSession, token: str) -> tuple[user_schema.User, str]:
+        """
+        Exchange a refresh token for a new one
+
+        The presented token is revoked with a single conditional
+        UPDATE ... RETURNING, so of two concurrent refreshes with the same
+        token only one rotates it. Presenting it again within
+        REFRESH_TOKEN_REUSE_GRACE_SECONDS (two tabs refreshing at once)
+        returns the successor already issued for it, as long as that is still
+        live. Any later reuse means the token leaked (or the client replayed
+        it): the whole family is revoked and the user has to log in again.
+
+        Args:
+            db (AsyncSession): The async database session
+            token (str): The refresh token from the client
+
+        Returns:
+            tuple[user_schema.User, str]: The token's user and the new refresh
+                token
+
+        Raises:
+            InvalidRefreshTokenException: If the token is unknown, expired,
+                revoked or belongs to an inactive user
+            DatabaseOperationException: If the database operation fails
+        """
+        RefreshToken = db_models.RefreshToken
+        token_hash = hash_refresh_token(token)
+        now = datetime.now(timezone.utc)
+        new_token = create_refresh_token()
+        try:
+            claimed = (
+                await db.execute(
+                    update(RefreshToken)
+                    .where(
+                        RefreshToken.token_hash == token_hash,
+                        RefreshToken.revoked.is_(False),
+                        RefreshToken.expires_at > now,
+                    )
+                    .values(
+                        revoked=True,
+                        rotated_at=now,
+                        successor=seal_successor_token(new_token, token),
+                    )
+                    .returning(RefreshToken.user_id, RefreshToken.family_id)
+                )
+            ).first()
+            if claimed is not None:
+                user_id = claimed.user_id
+            else:
+                replayed = await AsyncRefreshTokenService._successor_in_grace(
+                    db, token, now
+                )
+                if replayed is None:
+                    await db.execute(
+                        update(RefreshToken)
+                        .where(
+                            RefreshToken.family_id.in_(
+                                select(RefreshToken.family_id).where(
+                                    RefreshToken.token_hash == token_hash,
+                                    RefreshToken.revoked.is_(True),
+                                )
+                            )
+                        )
+                        .values(revoked=True)
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+                    raise InvalidRefreshTokenException()
+                user_id, new_token = replayed
+
+            user = await db.get(db_models.User, user_id)
+            if user is None or user.is_active is False:
+                await db.commit()
+                raise InvalidRefreshTokenException()
+            if claimed is not None:
+                db.add(
+                    RefreshToken(
+                        token_hash=hash_refresh_token(new_token),
+                        user_id=user_id,
+                        family_id=claimed.family_id,
+                        expires_at=now
+                        + timedelta(days=settings_config.REFRESH_TOKEN_EXPIRE_DAYS),
+                    )
+                )
+            await db.commit()
+        except (InvalidRefreshTokenException, DatabasePoolExhaustedException):
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "rotate_refresh_token", f"Unexpected error: {str(e)}"
+            )
+        return user, new_token
+
+    @staticmethod
+    async def _successor_in_grace(
+        db: AsyncSession, token: str, now: datetime
+    ) -> tuple[UUID, str] | None:
+        # The successor of a token rotated within the grace window, while the
+        # successor itself is still live (not rotated, revoked or expired)
+        RefreshToken = db_models.RefreshToken
+        grace = timedelta(seconds=settings_config.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+        sealed = await db.scalar(
+            select(RefreshToken.successor).where(
+                RefreshToken.token_hash == hash_refresh_token(token),
+                RefreshToken.rotated_at > now - grace,
+                RefreshToken.successor.is_not(None),
+            )
+        )
+        if sealed is None:
+            return None
+        successor = open_successor_token(sealed, token)
+        user_id = await db.scalar(
+            select(RefreshToken.user_id).where(
+                RefreshToken.token_hash == hash_refresh_token(successor),
+                RefreshToken.revoked.is_(False),
+                RefreshToken.expires_at > now,
+            )
+        )
+        return (user_id, successor) if user_id is not None else None
+
+    @staticmethod
+    async def revoke(db: AsyncSession, token: str) -> None:
+        """
+        Revoke the family of a refresh token, ending that login everywhere it
+        was rotated to
+
+        Args:
+            db (AsyncSession): The async database session
+            token (str): The refresh token from the client
+
+        Raises:
+            DatabaseOperationException: If the database operation fails
+        """
+        RefreshToken = db_models.RefreshToken
+        try:
+            await db.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.family_id.in_(
+                        select(RefreshToken.family_id).where(
+                            RefreshToken.token_hash == hash_refresh_token(token)
+                        )
+                    )
+                )
+                .values(revoked=True)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "revoke_refresh_token", f"Unexpected error: {str(e)}"
+            )
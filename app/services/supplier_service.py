@@ -1,17 +1,149 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
+from pydantic import ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    String,
+    and_,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.events import supplier_events
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.response_cache import supplier_cache
+from app.core.responses import dump_json
 from app.db import db_models
-from app.exceptions.database import DatabaseOperationException
+from app.db.database import READ_REPLICA
+from app.exceptions.database import (
+    DatabaseOperationException,
+    DatabasePoolExhaustedException,
+)
 from app.exceptions.supplier import (
+    InvalidSupplierChangeTokenException,
+    InvalidSupplierCursorException,
     SupplierAlreadyExistsException,
+    SupplierChangeTokenExpiredException,
     SupplierNotFoundException,
+    SupplierVersionMismatchException,
 )
 from app.schemas import supplier as supplier_schema
 
 
+def conflicting_supplier_field(error: IntegrityError) -> str | None:
+    """
+    Work out which unique supplier field an IntegrityError was raised for
+
+    Args:
+        error (IntegrityError): The error raised by the database
+
+    Returns:
+        str | None: "email" or "phone", or None for any other integrity error
+    """
+    message = str(error.orig)
+    for field in ("email", "phone"):
+        if f"ix_suppliers_{field}" in message or f"suppliers.{field}" in message:
+            return field
+    return None
+
+
+def supplier_id_in(db: AsyncSession, supplier_ids: Sequence[UUID]) -> ColumnElement:
+    """
+    Build a ``Supplier.id IN (...)`` condition for a batch of IDs
+
+    On Postgres the IDs are sent as a single array parameter
+    (``id = ANY(:ids)``), so the statement is the same for any batch size.
+
+    Args:
+        db (AsyncSession): The async database session the condition runs on
+        supplier_ids (Sequence[UUID]): The IDs to match
+
+    Returns:
+        ColumnElement: The WHERE condition
+    """
+    if db.bind.dialect.name == "postgresql":
+        return db_models.Supplier.id == any_(
+            bindparam(
+                "supplier_ids",
+                list(supplier_ids),
+                type_=ARRAY(PG_UUID(as_uuid=True)),
+            )
+        )
+    return db_models.Supplier.id.in_(supplier_ids)
+
+
+def check_page_bounds(skip: int, limit: int) -> None:
+    """
+    Reject page bounds the database would misread
+
+    Postgres fails on a negative LIMIT or OFFSET and SQLite reads a negative
+    LIMIT as no limit at all; keyset pages also need at least one row to
+    take the next cursor from.
+
+    Args:
+        skip (int): Number of rows to skip
+        limit (int): Maximum number of rows to return
+
+    Raises:
+        ValueError: If skip is negative or limit is below 1
+    """
+    if skip < 0 or limit < 1:
+        raise ValueError(f"Invalid page bounds: skip={skip}, limit={limit}")
+
+
+# NOTIFY payloads are capped at 8000 bytes, so events are sent in batches
+# that stay below that whatever the broadcast backend
+MAX_EVENT_MESSAGE_BYTES = 7500
+
+
+async def publish_supplier_events(events: list[dict]) -> None:
+    """
+    Publish supplier events to WebSocket subscribers after a commit
+
+    Events are sent as JSON arrays of supplier_schema.SupplierEvent, as many
+    per message as fit in MAX_EVENT_MESSAGE_BYTES.
+
+    Args:
+        events (list[dict]): Events with "type", "id" and optionally the
+            "supplier" row
+    """
+    if not supplier_events.active:
+        return
+    batch: list[str] = []
+    size = 0
+    for event in events:
+        encoded = dump_json(supplier_schema.SupplierEvent, event)
+        if batch and size + len(encoded) + 2 > MAX_EVENT_MESSAGE_BYTES:
+            await supplier_events.publish(f"[{','.join(batch)}]")
+            batch = []
+            size = 0
+        batch.append(encoded.decode())
+        size += len(encoded) + 1
+    if batch:
+        await supplier_events.publish(f"[{','.join(batch)}]")
+
+
 class SupplierService:
     @staticmethod
     def get_supplier(db: Session, supplier_id: UUID) -> supplier_schema.Supplier:
@@ -42,10 +174,16 @@ class SupplierService:
 
         Args:
             db (Session): The database session
+            skip (int): Number of suppliers to skip
+            limit (int): Maximum number of suppliers to return, at least 1
 
         Returns:
             list[supplier_schema.Supplier]: A list of all suppliers
+
+        Raises:
+            ValueError: If skip is negative or limit is below 1
         """
+        check_page_bounds(skip, limit)
         suppliers = db.query(db_models.Supplier).offset(skip).limit(limit).all()
         return suppliers
 
@@ -56,6 +194,10 @@ class SupplierService:
         """
         Create a new supplier
 
+        Runs a single INSERT ... ON CONFLICT DO NOTHING RETURNING; the unique
+        email/phone indexes decide duplicates, so concurrent creates cannot race
+        past a separate existence check.
+
         Args:
             db (Session): The database session
             supplier (supplier_schema.SupplierCreate): The suppliers data to store/create
@@ -64,122 +206,1260 @@ class SupplierService:
             supplier_schema.Supplier: The newly created supplier
 
         Raises:
-            SupplierAlreadyExistsException: If a supplier with the same email already exists
+            SupplierAlreadyExistsException: If a supplier with the same email or phone already exists
             DatabaseOperationException: If the database operation fails
         """
-        # Check if supplier already exists
-        existing_supplier = (
-            db.query(db_models.Supplier)
-            .filter(
-                (db_models.Supplier.email == supplier.email)
-                | (db_models.Supplier.phone == supplier.phone)
-            )
-            .first()
-        )
-        if existing_supplier:
-            if existing_supplier.email == supplier.email:
-                raise SupplierAlreadyExistsException("email", supplier.email)
-            else:
-                raise SupplierAlreadyExistsException("phone", supplier.phone)
-
-        # If not, create the new supplier
-        new_supplier = db_models.Supplier(**supplier.dict())
         try:
-            db.add(new_supplier)
+            new_supplier = db.scalar(
+                pg_insert(db_models.Supplier)
+                .values(**supplier.dict())
+                .on_conflict_do_nothing()
+                .returning(db_models.Supplier)
+            )
             db.commit()
-            db.refresh(new_supplier)
-            return new_supplier
         except IntegrityError as e:
             db.rollback()
             raise DatabaseOperationException(
                 "create_supplier", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "create_supplier", f"Unexpected error: {str(e)}"
             )
 
+        if new_supplier is None:
+            # Only the conflict path pays for a lookup, to report the field
+            existing = (
+                db.execute(
+                    select(db_models.Supplier.email).filter(
+                        (db_models.Supplier.email == supplier.email)
+                        | (db_models.Supplier.phone == supplier.phone)
+                    )
+                )
+            ).first()
+            if existing is not None and existing.email == supplier.email:
+                raise SupplierAlreadyExistsException("email", supplier.email)
+            raise SupplierAlreadyExistsException("phone", supplier.phone)
+        return new_supplier
+
     @staticmethod
     def update_supplier(
-        db: Session, supplier_id: UUID, supplier: supplier_schema.SupplierUpdate
+        db: Session,
+        supplier_id: UUID,
+        supplier: supplier_schema.SupplierUpdate,
+        expected_versions: list[int] | None = None,
     ) -> supplier_schema.Supplier:
         """
-        Update a supplier by ID
+        Update a supplier by ID with a single UPDATE ... RETURNING
+
+        The row version is bumped in the same statement. With
+        ``expected_versions`` (from If-Match) the update only applies while
+        the row is still at one of those versions.
 
         Args:
             db (Session): The database session
             supplier_id (UUID): The ID of the supplier to update
             supplier (supplier_schema.SupplierUpdate): The updated supplier data
+            expected_versions (list[int] | None): Versions the update may apply
+                to, or None for any
 
         Returns:
             supplier_schema.Supplier: The updated supplier
 
         Raises:
             SupplierNotFoundException: If the supplier with the given ID is not found
+            SupplierVersionMismatchException: If the supplier is not at an expected version
+            SupplierAlreadyExistsException: If the new email or phone belongs to another supplier
             DatabaseOperationException: If the database operation fails
         """
-        existing_supplier = (
-            db.query(db_models.Supplier).filter_by(id=supplier_id).first()
-        )
-        if existing_supplier is None:
-            raise SupplierNotFoundException(
-                f"Supplier with ID {supplier_id} not found!"
-            )
-
-        # Update the supplier data if exists
         update_data = {k: v for k, v in supplier.dict().items() if v is not None}
-        for key, value in update_data.items():
-            setattr(
-                existing_supplier, key, value
-            )  # This automatically updates the supplier data with new values
+        if not update_data:
+            current = SupplierService.get_supplier(db, supplier_id)
+            if (
+                expected_versions is not None
+                and current.version not in expected_versions
+            ):
+                raise SupplierVersionMismatchException(supplier_id)
+            return current
 
+        query = update(db_models.Supplier).where(db_models.Supplier.id == supplier_id)
+        if expected_versions is not None:
+            query = query.where(db_models.Supplier.version.in_(expected_versions))
         try:
+            updated_supplier = db.scalar(
+                query.values(
+                    **update_data, version=db_models.Supplier.version + 1
+                ).returning(db_models.Supplier)
+            )
             db.commit()
-            db.refresh(existing_supplier)
-            return existing_supplier
         except IntegrityError as e:
             db.rollback()
+            field = conflicting_supplier_field(e)
+            if field is not None:
+                raise SupplierAlreadyExistsException(field, update_data.get(field))
             raise DatabaseOperationException(
                 "update_supplier", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "update_supplier", f"Unexpected error: {str(e)}"
             )
 
+        if updated_supplier is None:
+            SupplierService._raise_missing_or_modified(
+                db, supplier_id, expected_versions
+            )
+        return updated_supplier
+
     @staticmethod
-    def delete_supplier(db: Session, supplier_id: UUID) -> None:
+    def delete_supplier(
+        db: Session, supplier_id: UUID, expected_versions: list[int] | None = None
+    ) -> None:
         """
-        Delete a supplier by ID
+        Delete a supplier by ID with a single DELETE ... RETURNING
 
         Args:
             db (Session): The database session
             supplier_id (UUID): The ID of the supplier to delete
+            expected_versions (list[int] | None): Versions the delete may apply
+                to (from If-Match), or None for any
 
         Raises:
             SupplierNotFoundException: If the supplier with the given ID is not found
+            SupplierVersionMismatchException: If the supplier is not at an expected version
             DatabaseOperationException: If the database operation fails
         """
-        existing_supplier = (
-            db.query(db_models.Supplier).filter_by(id=supplier_id).first()
-        )
-        if existing_supplier is None:
-            raise SupplierNotFoundException(
-                f"Supplier with ID {supplier_id} not found!"
-            )
-
+        query = delete(db_models.Supplier).where(db_models.Supplier.id == supplier_id)
+        if expected_versions is not None:
+            query = query.where(db_models.Supplier.version.in_(expected_versions))
         try:
-            db.delete(existing_supplier)
+            deleted_id = db.scalar(query.returning(db_models.Supplier.id))
             db.commit()
         except IntegrityError as e:
             db.rollback()
             raise DatabaseOperationException(
                 "delete_supplier", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "delete_supplier", f"Unexpected error: {str(e)}"
             )
+
+        if deleted_id is None:
+            SupplierService._raise_missing_or_modified(
+                db, supplier_id, expected_versions
+            )
+
+    @staticmethod
+    def _raise_missing_or_modified(
+        db: Session, supplier_id: UUID, expected_versions: list[int] | None
+    ) -> None:
+        # A conditional write that matched no row needs one lookup to tell a
+        # missing supplier from a version mismatch
+        if expected_versions is not None:
+            exists = db.scalar(
+                select(db_models.Supplier.id).where(
+                    db_models.Supplier.id == supplier_id
+                )
+            )
+            if exists is not None:
+                raise SupplierVersionMismatchException(supplier_id)
+        raise SupplierNotFoundException(supplier_id)
+
+
+class AsyncSupplierService:
+    @staticmethod
+    async def get_supplier(
+        db: AsyncSession, supplier_id: UUID, use_replica: bool = True
+    ) -> supplier_schema.Supplier:
+        """
+        Get a supplier by ID
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier_id (UUID): The ID of the supplier to retrieve
+            use_replica (bool): Allow the read to be served by a read replica
+
+        Returns:
+            supplier_schema.Supplier: The supplier with the given ID
+
+        Raises:
+            SupplierNotFoundException: If the supplier with the given ID is not found
+        """
+        supplier = await db.scalar(
+            select(db_models.Supplier).where(db_models.Supplier.id == supplier_id),
+            bind_arguments=READ_REPLICA if use_replica else None,
+        )
+        if supplier is None:
+            raise SupplierNotFoundException(supplier_id)
+        return supplier
+
+    @staticmethod
+    async def get_suppliers(
+        db: AsyncSession, skip: int = 0, limit: int = 100
+    ) -> list[supplier_schema.Supplier]:
+        """
+        Get all the list of suppliers
+
+        Args:
+            db (AsyncSession): The async database session
+            skip (int): Number of suppliers to skip
+            limit (int): Maximum number of suppliers to return, at least 1
+
+        Returns:
+            list[supplier_schema.Supplier]: A list of all suppliers
+
+        Raises:
+            ValueError: If skip is negative or limit is below 1
+        """
+        check_page_bounds(skip, limit)
+        result = await db.execute(
+            select(db_models.Supplier).offset(skip).limit(limit),
+            bind_arguments=READ_REPLICA,
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_suppliers_by_ids(
+        db: AsyncSession, supplier_ids: Sequence[UUID]
+    ) -> list[supplier_schema.Supplier]:
+        """
+        Get many suppliers by ID in one query
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier_ids (Sequence[UUID]): The IDs to fetch, without duplicates
+
+        Returns:
+            list[supplier_schema.Supplier]: The suppliers found, in the order of
+                supplier_ids; missing IDs are skipped
+        """
+        Supplier = db_models.Supplier
+        result = await db.execute(
+            select(Supplier).where(supplier_id_in(db, supplier_ids)),
+            bind_arguments=READ_REPLICA,
+        )
+        suppliers = {supplier.id: supplier for supplier in result.scalars()}
+        return [
+            suppliers[supplier_id]
+            for supplier_id in supplier_ids
+            if supplier_id in suppliers
+        ]
+
+    @staticmethod
+    async def get_suppliers_page(
+        db: AsyncSession, cursor: str | None = None, limit: int = 100
+    ) -> supplier_schema.SupplierPage:
+        """
+        Get a page of suppliers using keyset pagination on (name, id)
+
+        Unlike offset pagination, the cost of a page does not grow with its
+        depth and rows inserted concurrently do not shift later pages.
+        Suppliers without a name sort last, matching Postgres' NULLS LAST.
+
+        Args:
+            db (AsyncSession): The async database session
+            cursor (str | None): The next_cursor of the previous page, or None
+                for the first page
+            limit (int): Maximum number of suppliers to return, at least 1
+
+        Returns:
+            supplier_schema.SupplierPage: The suppliers and the cursor of the
+                next page (None on the last page)
+
+        Raises:
+            InvalidSupplierCursorException: If the cursor is malformed
+            ValueError: If limit is below 1
+        """
+        check_page_bounds(0, limit)
+        Supplier = db_models.Supplier
+        query = select(Supplier).order_by(Supplier.name.asc().nulls_last(), Supplier.id)
+
+        if cursor:
+            try:
+                last_name, last_id = decode_cursor(cursor)
+                if not isinstance(last_name, (str, type(None))) or not isinstance(
+                    last_id, str
+                ):
+                    raise ValueError("Invalid cursor")
+                last_id = UUID(last_id)
+            except (ValueError, TypeError):
+                raise InvalidSupplierCursorException(cursor)
+            if last_name is None:
+                query = query.where(
+                    and_(Supplier.name.is_(None), Supplier.id > last_id)
+                )
+            else:
+                query = query.where(
+                    or_(
+                        tuple_(Supplier.name, Supplier.id) > tuple_(last_name, last_id),
+                        Supplier.name.is_(None),
+                    )
+                )
+
+        # Fetch one extra row to know whether another page follows
+        result = await db.execute(query.limit(limit + 1), bind_arguments=READ_REPLICA)
+        suppliers = result.scalars().all()
+
+        next_cursor = None
+        if len(suppliers) > limit:
+            suppliers = suppliers[:limit]
+            last = suppliers[-1]
+            next_cursor = encode_cursor([last.name, str(last.id)])
+
+        return supplier_schema.SupplierPage(items=suppliers, next_cursor=next_cursor)
+
+    @staticmethod
+    async def get_supplier_changes(
+        db: AsyncSession,
+        since: str | None = None,
+        limit: int = 1000,
+        token_lifetime: timedelta | None = None,
+    ) -> supplier_schema.SupplierChanges:
+        """
+        Get the suppliers created, updated or deleted after a change token
+
+        Every write stamps the row with its transaction ID and the next value
+        of supplier_change_seq, and every delete leaves a tombstone stamped
+        the same way, so the changes since a token are an index range scan on
+        (change_txid, change_seq). Writers take no lock for this: on Postgres
+        only changes of transactions older than the snapshot's xmin are
+        returned. Those have all finished, so no change can later commit
+        behind a token; a long-running transaction delays the feed until it
+        ends but loses nothing. Positions are read from both tables in one
+        statement (one snapshot); the rows themselves are then fetched by ID
+        and may already reflect a later write, which the next sync delivers
+        again.
+
+        Args:
+            db (AsyncSession): The async database session
+            since (str | None): The next_token of the previous sync, or None
+                to start from the beginning
+            limit (int): Maximum number of changes to return
+            token_lifetime (timedelta | None): How long a token stays valid;
+                older tokens may have missed pruned tombstones. None accepts
+                tokens of any age
+
+        Returns:
+            supplier_schema.SupplierChanges: Changed suppliers, deleted IDs and
+                the token to pass as ``since`` next time
+
+        Raises:
+            InvalidSupplierChangeTokenException: If the token is malformed
+            SupplierChangeTokenExpiredException: If the token is older than
+                ``token_lifetime``
+        """
+        Supplier = db_models.Supplier
+        Tombstone = db_models.SupplierTombstone
+        now = int(time.time())
+        since_position = (0, 0)
+        issued_at = now
+        if since:
+            try:
+                since_txid, since_seq, issued_at = decode_cursor(since)
+                # bool is an int subclass; anything else would reach the query
+                for value in (since_txid, since_seq, issued_at):
+                    if not isinstance(value, int) or isinstance(value, bool):
+                        raise ValueError("Invalid change token")
+            except (ValueError, TypeError):
+                raise InvalidSupplierChangeTokenException(since)
+            if token_lifetime is not None and (
+                issued_at < now - token_lifetime.total_seconds()
+            ):
+                raise SupplierChangeTokenExpiredException()
+            since_position = (since_txid, since_seq)
+
+        # Changes of transactions at or past xmin may still be in flight
+        if db.bind.dialect.name == "postgresql":
+            settled = func.txid_snapshot_xmin(func.txid_current_snapshot())
+        else:
+            settled = None
+
+        def positions_of(table, deleted: bool):
+            query = select(
+                table.id,
+                table.change_txid,
+                table.change_seq,
+                literal(deleted).label("deleted"),
+            ).where(tuple_(table.change_txid, table.change_seq) > since_position)
+            if settled is not None:
+                query = query.where(table.change_txid < settled)
+            return query
+
+        changes = union_all(
+            positions_of(Supplier, False), positions_of(Tombstone, True)
+        ).subquery()
+        result = await db.execute(
+            select(changes)
+            .order_by(changes.c.change_txid, changes.c.change_seq)
+            .limit(limit + 1),
+            bind_arguments=READ_REPLICA,
+        )
+        positions = result.all()
+        has_more = len(positions) > limit
+        positions = positions[:limit]
+
+        changed_ids = [row.id for row in positions if not row.deleted]
+        changed = []
+        if changed_ids:
+            result = await db.execute(
+                select(Supplier)
+                .where(supplier_id_in(db, changed_ids))
+                .order_by(Supplier.change_txid, Supplier.change_seq),
+                bind_arguments=READ_REPLICA,
+            )
+            changed = result.scalars().all()
+
+        if positions:
+            last = positions[-1]
+            next_position = [last.change_txid, last.change_seq]
+        else:
+            next_position = list(since_position)
+        # A caught-up client has seen every settled tombstone, so its token
+        # is as good as new. Mid-way it keeps the age of the sync's start,
+        # since tombstones past the page may be as old as that
+        return supplier_schema.SupplierChanges(
+            changed=changed,
+            deleted=[row.id for row in positions if row.deleted],
+            next_token=encode_cursor(
+                [*next_position, issued_at if has_more else now]
+            ),
+            has_more=has_more,
+        )
+
+    @staticmethod
+    async def prune_tombstones(db: AsyncSession, retention: timedelta) -> int:
+        """
+        Delete the tombstones of suppliers deleted longer ago than retention
+
+        The newest tombstone is always kept, as SQLite derives the next change
+        position from the highest one in use.
+
+        Args:
+            db (AsyncSession): The async database session
+            retention (timedelta): How long tombstones are kept
+
+        Returns:
+            int: The number of tombstones deleted
+
+        Raises:
+            DatabaseOperationException: If there's an error during the database
+                operation
+            DatabasePoolExhaustedException: If no database connection is
+                available
+        """
+        Tombstone = db_models.SupplierTombstone
+        newest = select(func.max(Tombstone.change_seq)).scalar_subquery()
+        try:
+            result = await db.execute(
+                delete(Tombstone).where(
+                    Tombstone.deleted_at < datetime.now(timezone.utc) - retention,
+                    Tombstone.change_seq < newest,
+                )
+            )
+            await db.commit()
+            return result.rowcount
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "prune_tombstones", f"Unexpected error: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_supplier_stats(
+        db: AsyncSession,
+        top_domains: int = 10,
+        days: int = 7,
+        recent: int = 10,
+        approximate: bool = False,
+    ) -> supplier_schema.SupplierStats:
+        """
+        Get dashboard statistics from the precomputed supplier counters
+
+        The counts are primary-key reads of supplier_counts, which triggers on
+        suppliers keep current, and recently added suppliers come off the
+        created_at index, so no query scans the suppliers table.
+
+        Args:
+            db (AsyncSession): The async database session
+            top_domains (int): Number of email domains to return, largest first
+            days (int): Number of days (UTC, today included) of added counts
+            recent (int): Number of most recently created suppliers to return
+            approximate (bool): Also return the planner's row estimate for the
+                suppliers table (Postgres only)
+
+        Returns:
+            supplier_schema.SupplierStats: The statistics
+        """
+        Supplier = db_models.Supplier
+        SupplierCount = db_models.SupplierCount
+        today = datetime.now(timezone.utc).date()
+        day_buckets = {
+            f"day:{today - timedelta(days=offset)}": today - timedelta(days=offset)
+            for offset in range(days)
+        }
+
+        result = await db.execute(
+            select(SupplierCount.bucket, SupplierCount.supplier_count).where(
+                SupplierCount.bucket.in_(["*", *day_buckets])
+            ),
+            bind_arguments=READ_REPLICA,
+        )
+        counts = dict(result.all())
+
+        result = await db.execute(
+            select(SupplierCount.bucket, SupplierCount.supplier_count)
+            .where(
+                SupplierCount.bucket.startswith("domain:"),
+                SupplierCount.supplier_count > 0,
+            )
+            .order_by(SupplierCount.supplier_count.desc(), SupplierCount.bucket)
+            .limit(top_domains),
+            bind_arguments=READ_REPLICA,
+        )
+        domains = [
+            supplier_schema.SupplierDomainCount(
+                domain=bucket.removeprefix("domain:"), count=count
+            )
+            for bucket, count in result.all()
+        ]
+
+        result = await db.execute(
+            select(Supplier)
+            .where(Supplier.created_at.is_not(None))
+            .order_by(Supplier.created_at.desc())
+            .limit(recent),
+            bind_arguments=READ_REPLICA,
+        )
+        recently_added = result.scalars().all()
+
+        approximate_total = None
+        if approximate and db.bind.dialect.name == "postgresql":
+            estimate = await db.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'suppliers'::regclass"
+                ),
+                bind_arguments=READ_REPLICA,
+            )
+            # -1 until the table has been vacuumed or analyzed once
+            if estimate is not None and estimate >= 0:
+                approximate_total = estimate
+
+        return supplier_schema.SupplierStats(
+            total=counts.get("*", 0),
+            approximate_total=approximate_total,
+            top_domains=domains,
+            added_per_day=[
+                supplier_schema.SupplierDailyCount(day=day, count=counts.get(bucket, 0))
+                for bucket, day in day_buckets.items()
+            ],
+            recently_added=recently_added,
+        )
+
+    @staticmethod
+    async def search_suppliers(
+        db: AsyncSession, q: str, skip: int = 0, limit: int = 100
+    ) -> list[supplier_schema.Supplier]:
+        """
+        Search suppliers by name, email, phone or address
+
+        Substring matches are served by the pg_trgm GIN indexes on each column
+        and ranked by their best trigram similarity to the query, so fuzzy
+        matches on the name are returned as well. Other databases fall back
+        to an unranked substring match ordered by name.
+
+        Args:
+            db (AsyncSession): The async database session
+            q (str): The search text
+            skip (int): Number of results to skip
+            limit (int): Maximum number of results to return, at least 1
+
+        Returns:
+            list[supplier_schema.Supplier]: The matching suppliers, best first
+
+        Raises:
+            ValueError: If skip is negative or limit is below 1
+        """
+        check_page_bounds(skip, limit)
+        Supplier = db_models.Supplier
+        columns = [
+            getattr(Supplier, name) for name in db_models.SUPPLIER_SEARCH_COLUMNS
+        ]
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        matches = [column.ilike(f"%{escaped}%", escape="\\") for column in columns]
+
+        if db.bind.dialect.name == "postgresql":
+            rank = func.greatest(*(func.similarity(column, q) for column in columns))
+            query = (
+                select(Supplier)
+                .where(or_(*matches, Supplier.name.op("%")(q)))
+                .order_by(rank.desc(), Supplier.name, Supplier.id)
+            )
+        else:
+            query = (
+                select(Supplier)
+                .where(or_(*matches))
+                .order_by(Supplier.name, Supplier.id)
+            )
+
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.scalars().all()
+
+    EXPORT_COLUMNS = ("id", "name", "email", "address", "phone")
+
+    @staticmethod
+    async def stream_suppliers(
+        db: AsyncSession, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream every supplier in batches using a server-side cursor
+
+        Rows are fetched as plain column tuples (no ORM objects), so memory
+        stays flat regardless of the table size.
+
+        Args:
+            db (AsyncSession): The async database session, kept open for the
+                whole iteration
+            batch_size (int): Number of rows fetched per round trip
+
+        Yields:
+            Sequence[Row]: Batches of rows in EXPORT_COLUMNS order
+        """
+        columns = [
+            getattr(db_models.Supplier, column)
+            for column in AsyncSupplierService.EXPORT_COLUMNS
+        ]
+        result = await db.stream(
+            select(*columns)
+            .order_by(db_models.Supplier.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    async def create_supplier(
+        db: AsyncSession, supplier: supplier_schema.SupplierCreate
+    ) -> supplier_schema.Supplier:
+        """
+        Create a new supplier
+
+        Runs a single INSERT ... ON CONFLICT DO NOTHING RETURNING; the unique
+        email/phone indexes decide duplicates, so concurrent creates cannot race
+        past a separate existence check.
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier (supplier_schema.SupplierCreate): The suppliers data to store/create
+
+        Returns:
+            supplier_schema.Supplier: The newly created supplier
+
+        Raises:
+            SupplierAlreadyExistsException: If a supplier with the same email or phone already exists
+            DatabaseOperationException: If the database operation fails
+        """
+        try:
+            new_supplier = await db.scalar(
+                pg_insert(db_models.Supplier)
+                .values(**supplier.dict())
+                .on_conflict_do_nothing()
+                .returning(db_models.Supplier)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "create_supplier", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "create_supplier", f"Unexpected error: {str(e)}"
+            )
+
+        if new_supplier is None:
+            # Only the conflict path pays for a lookup, to report the field
+            existing = (
+                await db.execute(
+                    select(db_models.Supplier.email).filter(
+                        (db_models.Supplier.email == supplier.email)
+                        | (db_models.Supplier.phone == supplier.phone)
+                    )
+                )
+            ).first()
+            if existing is not None and existing.email == supplier.email:
+                raise SupplierAlreadyExistsException("email", supplier.email)
+            raise SupplierAlreadyExistsException("phone", supplier.phone)
+        await supplier_cache.invalidate()
+        await publish_supplier_events(
+            [{"type": "created", "id": new_supplier.id, "supplier": new_supplier}]
+        )
+        return new_supplier
+
+    @staticmethod
+    async def update_supplier(
+        db: AsyncSession,
+        supplier_id: UUID,
+        supplier: supplier_schema.SupplierUpdate,
+        expected_versions: list[int] | None = None,
+    ) -> supplier_schema.Supplier:
+        """
+        Update a supplier by ID with a single UPDATE ... RETURNING
+
+        The row version is bumped in the same statement. With
+        ``expected_versions`` (from If-Match) the update only applies while
+        the row is still at one of those versions.
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier_id (UUID): The ID of the supplier to update
+            supplier (supplier_schema.SupplierUpdate): The updated supplier data
+            expected_versions (list[int] | None): Versions the update may apply
+                to, or None for any
+
+        Returns:
+            supplier_schema.Supplier: The updated supplier
+
+        Raises:
+            SupplierNotFoundException: If the supplier with the given ID is not found
+            SupplierVersionMismatchException: If the supplier is not at an expected version
+            SupplierAlreadyExistsException: If the new email or phone belongs to another supplier
+            DatabaseOperationException: If the database operation fails
+        """
+        update_data = {k: v for k, v in supplier.dict().items() if v is not None}
+        if not update_data:
+            # A lagging replica could accept a version If-Match should reject
+            current = await AsyncSupplierService.get_supplier(
+                db, supplier_id, use_replica=False
+            )
+            if (
+                expected_versions is not None
+                and current.version not in expected_versions
+            ):
+                raise SupplierVersionMismatchException(supplier_id)
+            return current
+
+        query = update(db_models.Supplier).where(db_models.Supplier.id == supplier_id)
+        if expected_versions is not None:
+            query = query.where(db_models.Supplier.version.in_(expected_versions))
+        try:
+            updated_supplier = await db.scalar(
+                query.values(
+                    **update_data, version=db_models.Supplier.version + 1
+                ).returning(db_models.Supplier)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            field = conflicting_supplier_field(e)
+            if field is not None:
+                raise SupplierAlreadyExistsException(field, update_data.get(field))
+            raise DatabaseOperationException(
+                "update_supplier", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "update_supplier", f"Unexpected error: {str(e)}"
+            )
+
+        if updated_supplier is None:
+            await AsyncSupplierService._raise_missing_or_modified(
+                db, supplier_id, expected_versions
+            )
+        await supplier_cache.invalidate()
+        await publish_supplier_events(
+            [{"type": "updated", "id": supplier_id, "supplier": updated_supplier}]
+        )
+        return updated_supplier
+
+    @staticmethod
+    async def delete_supplier(
+        db: AsyncSession, supplier_id: UUID, expected_versions: list[int] | None = None
+    ) -> None:
+        """
+        Delete a supplier by ID with a single DELETE ... RETURNING
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier_id (UUID): The ID of the supplier to delete
+            expected_versions (list[int] | None): Versions the delete may apply
+                to (from If-Match), or None for any
+
+        Raises:
+            SupplierNotFoundException: If the supplier with the given ID is not found
+            SupplierVersionMismatchException: If the supplier is not at an expected version
+            DatabaseOperationException: If the database operation fails
+        """
+        query = delete(db_models.Supplier).where(db_models.Supplier.id == supplier_id)
+        if expected_versions is not None:
+            query = query.where(db_models.Supplier.version.in_(expected_versions))
+        try:
+            deleted_id = await db.scalar(query.returning(db_models.Supplier.id))
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "delete_supplier", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "delete_supplier", f"Unexpected error: {str(e)}"
+            )
+
+        if deleted_id is None:
+            await AsyncSupplierService._raise_missing_or_modified(
+                db, supplier_id, expected_versions
+            )
+        await supplier_cache.invalidate()
+        await publish_supplier_events([{"type": "deleted", "id": supplier_id}])
+
+    @staticmethod
+    async def _raise_missing_or_modified(
+        db: AsyncSession, supplier_id: UUID, expected_versions: list[int] | None
+    ) -> None:
+        # A conditional write that matched no row needs one lookup to tell a
+        # missing supplier from a version mismatch
+        if expected_versions is not None:
+            exists = await db.scalar(
+                select(db_models.Supplier.id).where(
+                    db_models.Supplier.id == supplier_id
+                )
+            )
+            if exists is not None:
+                raise SupplierVersionMismatchException(supplier_id)
+        raise SupplierNotFoundException(supplier_id)
+
+    @staticmethod
+    async def import_suppliers(
+        db: AsyncSession,
+        records: AsyncIterator[tuple[dict | None, str | None]],
+        chunk_size: int = 1000,
+    ) -> supplier_schema.SupplierImportResult:
+        """
+        Bulk import suppliers from a stream of parsed records
+
+        Records are validated and written in chunks: one multi-row
+        INSERT ... ON CONFLICT DO NOTHING per chunk, committed per chunk, so a
+        large import takes a couple of round trips per thousand rows instead of
+        four per row. Duplicates are rejected by the unique email/phone indexes.
+
+        Chunks already committed stay committed if a later chunk fails: the
+        import stops there and the result reports what was written, with the
+        failed chunk's rows as errors and ``aborted`` set. Records after the
+        failed chunk are not read.
+
+        Args:
+            db (AsyncSession): The async database session
+            records (AsyncIterator): (record, parse_error) pairs in input order
+            chunk_size (int): Number of rows validated and inserted per batch
+
+        Returns:
+            supplier_schema.SupplierImportResult: Counts, per-row errors and
+                throughput of the import
+        """
+        started_at = time.perf_counter()
+        received = 0
+        inserted = 0
+        errors: list[supplier_schema.SupplierImportError] = []
+        chunk: list[tuple[int, supplier_schema.SupplierCreate]] = []
+        aborted_reason = None
+
+        try:
+            async for record, parse_error in records:
+                received += 1
+                if parse_error is not None:
+                    errors.append(
+                        supplier_schema.SupplierImportError(
+                            row=received, error=parse_error
+                        )
+                    )
+                    continue
+                try:
+                    chunk.append((received, supplier_schema.SupplierCreate(**record)))
+                except ValidationError as e:
+                    message = "; ".join(
+                        f"{'.'.join(str(part) for part in error['loc'])}: "
+                        f"{error['msg']}"
+                        for error in e.errors()
+                    )
+                    errors.append(
+                        supplier_schema.SupplierImportError(row=received, error=message)
+                    )
+                if len(chunk) >= chunk_size:
+                    inserted += await AsyncSupplierService._import_chunk(
+                        db, chunk, errors
+                    )
+                    chunk = []
+
+            if chunk:
+                inserted += await AsyncSupplierService._import_chunk(db, chunk, errors)
+        except (DatabaseOperationException, DatabasePoolExhaustedException) as e:
+            aborted_reason = e.detail
+            reported = {error.row for error in errors}
+            errors.extend(
+                supplier_schema.SupplierImportError(
+                    row=row, error=f"Not imported: {e.detail}"
+                )
+                for row, _ in chunk
+                if row not in reported
+            )
+
+        elapsed = time.perf_counter() - started_at
+        errors.sort(key=lambda error: error.row)
+        return supplier_schema.SupplierImportResult(
+            received=received,
+            inserted=inserted,
+            failed=len(errors),
+            errors=errors,
+            elapsed_seconds=round(elapsed, 6),
+            rows_per_second=round(received / elapsed, 2) if elapsed > 0 else 0.0,
+            aborted=aborted_reason is not None,
+            aborted_reason=aborted_reason,
+        )
+
+    @staticmethod
+    async def _import_chunk(
+        db: AsyncSession,
+        chunk: list[tuple[int, supplier_schema.SupplierCreate]],
+        errors: list[supplier_schema.SupplierImportError],
+    ) -> int:
+        rows = []
+        row_numbers = {}
+        seen_phones = set()
+        for row, supplier in chunk:
+            if supplier.email in row_numbers:
+                error = f"Supplier with email '{supplier.email}' already exists"
+            elif supplier.phone in seen_phones:
+                error = f"Supplier with phone '{supplier.phone}' already exists"
+            else:
+                row_numbers[supplier.email] = row
+                seen_phones.add(supplier.phone)
+                rows.append(supplier.dict())
+                continue
+            errors.append(supplier_schema.SupplierImportError(row=row, error=error))
+
+        if not rows:
+            return 0
+
+        try:
+            result = await db.execute(
+                pg_insert(db_models.Supplier)
+                .on_conflict_do_nothing()
+                .returning(db_models.Supplier.id, db_models.Supplier.email),
+                rows,
+            )
+            inserted = result.all()
+            inserted_emails = {row.email for row in inserted}
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "import_suppliers", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "import_suppliers", f"Unexpected error: {str(e)}"
+            )
+
+        if inserted:
+            await supplier_cache.invalidate()
+            await publish_supplier_events(
+                [{"type": "created", "id": row.id} for row in inserted]
+            )
+
+        conflicts = [data for data in rows if data["email"] not in inserted_emails]
+        if conflicts:
+            # Only rows rejected by the unique indexes pay for a lookup
+            result = await db.execute(
+                select(db_models.Supplier.email).where(
+                    db_models.Supplier.email.in_([data["email"] for data in conflicts])
+                )
+            )
+            taken_emails = set(result.scalars())
+            for data in conflicts:
+                if data["email"] in taken_emails:
+                    error = f"Supplier with email '{data['email']}' already exists"
+                else:
+                    error = f"Supplier with phone '{data['phone']}' already exists"
+                errors.append(
+                    supplier_schema.SupplierImportError(
+                        row=row_numbers[data["email"]], error=error
+                    )
+                )
+        return len(inserted_emails)
+
+    @staticmethod
+    async def bulk_update_suppliers(
+        db: AsyncSession,
+        items: Sequence[supplier_schema.SupplierBulkUpdateItem],
+        chunk_size: int = 500,
+    ) -> supplier_schema.SupplierBulkResult:
+        """
+        Apply many supplier patches in one transaction
+
+        Patches setting the same fields are grouped and applied in chunks, one
+        UPDATE ... FROM (VALUES ...) RETURNING per chunk on Postgres, each
+        inside a savepoint. A chunk rejected by the unique email/phone indexes
+        is retried row by row so only the conflicting rows fail. Repeated IDs
+        are merged, later patches winning.
+
+        Args:
+            db (AsyncSession): The async database session
+            items (Sequence[supplier_schema.SupplierBulkUpdateItem]): The patches
+            chunk_size (int): Number of rows updated per statement
+
+        Returns:
+            supplier_schema.SupplierBulkResult: One result per supplier ID, in
+                request order
+
+        Raises:
+            DatabaseOperationException: If the database operation fails
+        """
+        patches: dict[UUID, dict] = {}
+        for item in items:
+            patches.setdefault(item.id, {}).update(
+                item.dict(exclude={"id"}, exclude_none=True)
+            )
+
+        statuses: dict[UUID, tuple[str, str | None]] = {}
+        groups: dict[tuple[str, ...], list[tuple[UUID, dict]]] = {}
+        for supplier_id, patch in patches.items():
+            groups.setdefault(tuple(sorted(patch)), []).append((supplier_id, patch))
+
+        updated = 0
+        try:
+            for fields, group in groups.items():
+                for start in range(0, len(group), chunk_size):
+                    chunk = group[start : start + chunk_size]
+                    if fields:
+                        updated += await AsyncSupplierService._bulk_update_chunk(
+                            db, fields, chunk, statuses
+                        )
+                    else:
+                        # Nothing to set; only report whether the row exists
+                        result = await db.execute(
+                            select(db_models.Supplier.id).where(
+                                supplier_id_in(db, [row[0] for row in chunk])
+                            )
+                        )
+                        existing = set(result.scalars())
+                        for supplier_id, _ in chunk:
+                            statuses[supplier_id] = (
+                                ("unchanged", None)
+                                if supplier_id in existing
+                                else ("not_found", None)
+                            )
+            await db.commit()
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "bulk_update_suppliers", f"Unexpected error: {str(e)}"
+            )
+
+        if updated:
+            await supplier_cache.invalidate()
+            await publish_supplier_events(
+                [
+                    {"type": "updated", "id": supplier_id}
+                    for supplier_id, (status, _) in statuses.items()
+                    if status == "updated"
+                ]
+            )
+        return AsyncSupplierService._bulk_result(list(patches), statuses)
+
+    @staticmethod
+    async def _bulk_update_chunk(
+        db: AsyncSession,
+        fields: tuple[str, ...],
+        chunk: list[tuple[UUID, dict]],
+        statuses: dict[UUID, tuple[str, str | None]],
+    ) -> int:
+        try:
+            async with db.begin_nested():
+                updated_ids = await AsyncSupplierService._update_rows(
+                    db, fields, chunk
+                )
+        except IntegrityError:
+            updated_ids = set()
+            for supplier_id, patch in chunk:
+                try:
+                    async with db.begin_nested():
+                        updated_ids |= await AsyncSupplierService._update_rows(
+                            db, fields, [(supplier_id, patch)]
+                        )
+                except IntegrityError as e:
+                    field = conflicting_supplier_field(e)
+                    statuses[supplier_id] = (
+                        "conflict",
+                        (
+                            f"Supplier with {field} '{patch[field]}' already exists"
+                            if field is not None
+                            else f"Integrity error: {str(e.orig)}"
+                        ),
+                    )
+
+        for supplier_id, _ in chunk:
+            if supplier_id in updated_ids:
+                statuses[supplier_id] = ("updated", None)
+            elif supplier_id not in statuses:
+                statuses[supplier_id] = ("not_found", None)
+        return len(updated_ids)
+
+    @staticmethod
+    async def _update_rows(
+        db: AsyncSession, fields: tuple[str, ...], rows: list[tuple[UUID, dict]]
+    ) -> set[UUID]:
+        Supplier = db_models.Supplier
+        if db.bind.dialect.name != "postgresql" or len(rows) == 1:
+            updated_ids = set()
+            for supplier_id, patch in rows:
+                updated_id = await db.scalar(
+                    update(Supplier)
+                    .where(Supplier.id == supplier_id)
+                    .values(**patch, version=Supplier.version + 1)
+                    .returning(Supplier.id)
+                )
+                if updated_id is not None:
+                    updated_ids.add(updated_id)
+            return updated_ids
+
+        patch_values = values(
+            column("id", PG_UUID(as_uuid=True)),
+            *(column(field, String) for field in fields),
+            name="patch",
+        ).data(
+            [
+                (supplier_id, *(patch[field] for field in fields))
+                for supplier_id, patch in rows
+            ]
+        )
+        result = await db.execute(
+            update(Supplier)
+            .where(Supplier.id == patch_values.c.id)
+            .values(
+                **{field: patch_values.c[field] for field in fields},
+                version=Supplier.version + 1,
+            )
+            .returning(Supplier.id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars())
+
+    @staticmethod
+    async def bulk_delete_suppliers(
+        db: AsyncSession, supplier_ids: Sequence[UUID], chunk_size: int = 500
+    ) -> supplier_schema.SupplierBulkResult:
+        """
+        Delete many suppliers in one transaction
+
+        Runs one DELETE ... WHERE id = ANY(:ids) RETURNING per chunk; IDs not
+        returned did not exist.
+
+        Args:
+            db (AsyncSession): The async database session
+            supplier_ids (Sequence[UUID]): The IDs to delete
+            chunk_size (int): Number of rows deleted per statement
+
+        Returns:
+            supplier_schema.SupplierBulkResult: One result per supplier ID, in
+                request order
+
+        Raises:
+            DatabaseOperationException: If the database operation fails
+        """
+        supplier_ids = list(dict.fromkeys(supplier_ids))
+        deleted_ids: set[UUID] = set()
+        try:
+            for start in range(0, len(supplier_ids), chunk_size):
+                result = await db.execute(
+                    delete(db_models.Supplier)
+                    .where(
+                        supplier_id_in(db, supplier_ids[start : start + chunk_size])
+                    )
+                    .returning(db_models.Supplier.id)
+                    .execution_options(synchronize_session=False)
+                )
+                deleted_ids.update(result.scalars())
+            await db.commit()
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "bulk_delete_suppliers", f"Unexpected error: {str(e)}"
+            )
+
+        if deleted_ids:
+            await supplier_cache.invalidate()
+            await publish_supplier_events(
+                [
+                    {"type": "deleted", "id": supplier_id}
+                    for supplier_id in supplier_ids
+                    if supplier_id in deleted_ids
+                ]
+            )
+        return AsyncSupplierService._bulk_result(
+            supplier_ids,
+            {
+                supplier_id: (
+                    "deleted" if supplier_id in deleted_ids else "not_found",
+                    None,
+                )
+                for supplier_id in supplier_ids
+            },
+        )
+
+    @staticmethod
+    def _bulk_result(
+        supplier_ids: Sequence[UUID], statuses: dict[UUID, tuple[str, str | None]]
+    ) -> supplier_schema.SupplierBulkResult:
+        results = []
+        for supplier_id in supplier_ids:
+            status, error = statuses[supplier_id]
+            if status == "not_found":
+                error = f"Supplier with id {supplier_id} not found"
+            results.append(
+                supplier_schema.SupplierBulkItemResult(
+                    id=supplier_id, status=status, error=error
+                )
+            )
+        failed = sum(result.error is not None for result in results)
+        return supplier_schema.SupplierBulkResult(
+            succeeded=len(results) - failed, failed=failed, results=results
+        )
@@ -1,11 +1,24 @@
 from uuid import UUID
 
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+from app.core.user_cache import user_cache
 from app.db import db_models
-from app.exceptions.database import DatabaseOperationException
+from app.db.database import READ_REPLICA
+from app.exceptions.database import (
+    DatabaseOperationException,
+    DatabasePoolExhaustedException,
+)
 from app.exceptions.user import UserAlreadyExistsException, UserNotFoundException
 from app.schemas import user as user_schema
 
@@ -66,7 +79,7 @@ class UserService:
     @staticmethod
     def create_user(db: Session, user: user_schema.UserCreate) -> user_schema.User:
         """
-        Create a new user
+        Create a new user with a single INSERT ... ON CONFLICT DO NOTHING
 
         Args:
             db (Session): The database session
@@ -79,42 +92,45 @@ class UserService:
             UserAlreadyExistsException: If a user with the same email already exists
             DatabaseOperationException: If the database operation fails
         """
-        # Check if user already exists
-        existing_user = db.query(db_models.User).filter_by(email=user.email).first()
-        if existing_user:
-            raise UserAlreadyExistsException("email", user.email)
-
-        # If not, create the new user
         hashed_password = get_password_hash(user.password)
-        new_user = db_models.User(
-            name=user.name, email=user.email, hashed_password=hashed_password
-        )
         try:
-            db.add(new_user)
+            new_user = db.scalar(
+                pg_insert(db_models.User)
+                .values(
+                    name=user.name, email=user.email, hashed_password=hashed_password
+                )
+                .on_conflict_do_nothing()
+                .returning(db_models.User)
+            )
             db.commit()
-            db.refresh(new_user)
-            return new_user
         except IntegrityError as e:
             db.rollback()
             raise DatabaseOperationException(
                 "create_user", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "create_user", f"Unexpected error: {str(e)}"
             )
 
+        if new_user is None:
+            raise UserAlreadyExistsException("email", user.email)
+        return new_user
+
     @staticmethod
     def update_user(
         db: Session, user_id: UUID, user: user_schema.UserUpdate
     ) -> user_schema.User:
         """
-        Update a user by ID
+        Update a user by ID with a single UPDATE ... RETURNING
 
         Args:
             db (Session): The database session
-            user_id (int): The ID of the user to update
+            user_id (UUID): The ID of the user to update
             user (user_schema.UserUpdate): The updated user data
 
         Returns:
@@ -122,67 +138,84 @@ class UserService:
 
         Raises:
             UserNotFoundException: If the user with the given ID is not found
+            UserAlreadyExistsException: If the new email belongs to another user
             DatabaseOperationException: If the database operation fails
         """
-        existing_user = db.query(db_models.User).filter_by(id=user_id).first()
-        if existing_user is None:
-            raise UserNotFoundException(f"User with ID {user_id} not found!")
-
-        # Update the user data if exists
         update_data = user.dict(exclude_unset=True)
         if "password" in update_data:
             update_data["hashed_password"] = get_password_hash(
                 update_data.pop("password")
             )
-        for key, value in update_data.items():
-            setattr(existing_user, key, value)
+        if not update_data:
+            return UserService.get_user(db, user_id)
 
         try:
+            updated_user = db.scalar(
+                update(db_models.User)
+                .where(db_models.User.id == user_id)
+                .values(**update_data)
+                .returning(db_models.User)
+            )
             db.commit()
-            db.refresh(existing_user)
-            return existing_user
         except IntegrityError as e:
             db.rollback()
+            if "email" in update_data and "email" in str(e.orig):
+                raise UserAlreadyExistsException("email", update_data["email"])
             raise DatabaseOperationException(
                 "update_user", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "update_user", f"Unexpected error: {str(e)}"
             )
 
+        if updated_user is None:
+            raise UserNotFoundException(user_id)
+        user_cache.invalidate(user_id)
+        return updated_user
+
     @staticmethod
     def delete_user(db: Session, user_id: UUID) -> None:
         """
-        Delete a user by ID
+        Delete a user by ID with a single DELETE ... RETURNING
 
         Args:
             db (Session): The database session
-            user_id (int): The ID of the user to delete
+            user_id (UUID): The ID of the user to delete
 
         Raises:
             UserNotFoundException: If the user with the given ID is not found
             DatabaseOperationException: If the database operation fails
         """
-        existing_user = db.query(db_models.User).filter_by(id=user_id).first()
-        if existing_user is None:
-            raise UserNotFoundException(f"User with ID {user_id} not found!")
-
         try:
-            db.delete(existing_user)
+            deleted_id = db.scalar(
+                delete(db_models.User)
+                .where(db_models.User.id == user_id)
+                .returning(db_models.User.id)
+            )
             db.commit()
         except IntegrityError as e:
             db.rollback()
             raise DatabaseOperationException(
                 "delete_user", f"Integrity error: {str(e)}"
             )
+        except DatabasePoolExhaustedException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise DatabaseOperationException(
                 "delete_user", f"Unexpected error: {str(e)}"
             )
 
+        if deleted_id is None:
+            raise UserNotFoundException(user_id)
+        user_cache.invalidate(user_id)
+
     @staticmethod
     def authenticate_user(db: Session, email: str, password: str) -> user_schema.User:
         """
@@ -206,3 +239,232 @@ class UserService:
         if not verify_password(password, user.hashed_password):
             raise ValueError("Incorrect password")
         return user
+
+
+class AsyncUserService:
+    @staticmethod
+    async def get_user(db: AsyncSession, user_id: UUID) -> user_schema.User:
+        """
+        Get a user by ID
+
+        Args:
+            db (AsyncSession): The async database session
+            user_id (UUID): The ID of the user to retrieve
+
+        Returns:
+            user_schema.User: The user with the given ID
+
+        Raises:
+            UserNotFoundException: If the user with the given ID is not found
+        """
+        user = await db.get(db_models.User, user_id)
+        if user is None:
+            raise UserNotFoundException(user_id)
+        return user
+
+    @staticmethod
+    async def get_user_by_email(
+        db: AsyncSession, email: str, use_replica: bool = False
+    ) -> user_schema.User:
+        """
+        Get a user by email
+
+        Args:
+            db (AsyncSession): The async database session
+            email (str): The email of the user to retrieve
+            use_replica (bool): Allow the lookup to be served by a read replica
+
+        Returns:
+            user_schema.User: The user with the given email
+        """
+        result = await db.execute(
+            select(db_models.User).filter_by(email=email),
+            bind_arguments=READ_REPLICA if use_replica else None,
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_users(
+        db: AsyncSession, skip: int = 0, limit: int = 100
+    ) -> list[user_schema.User]:
+        """
+        Get all users
+
+        Args:
+            db (AsyncSession): The async database session
+            skip (int): Number of users to skip
+            limit (int): Maximum number of users to return
+
+        Returns:
+            list[user_schema.User]: A list of users
+        """
+        result = await db.execute(select(db_models.User).offset(skip).limit(limit))
+        return result.scalars().all()
+
+    @staticmethod
+    async def create_user(
+        db: AsyncSession, user: user_schema.UserCreate
+    ) -> user_schema.User:
+        """
+        Create a new user with a single INSERT ... ON CONFLICT DO NOTHING
+
+        Args:
+            db (AsyncSession): The async database session
+            user (user_schema.UserCreate): The user data to store/create
+
+        Returns:
+            user_schema.User: The newly created user
+
+        Raises:
+            UserAlreadyExistsException: If a user with the same email already exists
+            DatabaseOperationException: If the database operation fails
+        """
+        hashed_password = await get_password_hash_async(user.password)
+        try:
+            new_user = await db.scalar(
+                pg_insert(db_models.User)
+                .values(
+                    name=user.name, email=user.email, hashed_password=hashed_password
+                )
+                .on_conflict_do_nothing()
+                .returning(db_models.User)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "create_user", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "create_user", f"Unexpected error: {str(e)}"
+            )
+
+        if new_user is None:
+            raise UserAlreadyExistsException("email", user.email)
+        return new_user
+
+    @staticmethod
+    async def update_user(
+        db: AsyncSession, user_id: UUID, user: user_schema.UserUpdate
+    ) -> user_schema.User:
+        """
+        Update a user by ID with a single UPDATE ... RETURNING
+
+        Args:
+            db (AsyncSession): The async database session
+            user_id (UUID): The ID of the user to update
+            user (user_schema.UserUpdate): The updated user data
+
+        Returns:
+            user_schema.User: The updated user
+
+        Raises:
+            UserNotFoundException: If the user with the given ID is not found
+            UserAlreadyExistsException: If the new email belongs to another user
+            DatabaseOperationException: If the database operation fails
+        """
+        update_data = user.dict(exclude_unset=True)
+        if "password" in update_data:
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
+        if not update_data:
+            return await AsyncUserService.get_user(db, user_id)
+
+        try:
+            updated_user = await db.scalar(
+                update(db_models.User)
+                .where(db_models.User.id == user_id)
+                .values(**update_data)
+                .returning(db_models.User)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            if "email" in update_data and "email" in str(e.orig):
+                raise UserAlreadyExistsException("email", update_data["email"])
+            raise DatabaseOperationException(
+                "update_user", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "update_user", f"Unexpected error: {str(e)}"
+            )
+
+        if updated_user is None:
+            raise UserNotFoundException(user_id)
+        user_cache.invalidate(user_id)
+        return updated_user
+
+    @staticmethod
+    async def delete_user(db: AsyncSession, user_id: UUID) -> None:
+        """
+        Delete a user by ID with a single DELETE ... RETURNING
+
+        Args:
+            db (AsyncSession): The async database session
+            user_id (UUID): The ID of the user to delete
+
+        Raises:
+            UserNotFoundException: If the user with the given ID is not found
+            DatabaseOperationException: If the database operation fails
+        """
+        try:
+            deleted_id = await db.scalar(
+                delete(db_models.User)
+                .where(db_models.User.id == user_id)
+                .returning(db_models.User.id)
+            )
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "delete_user", f"Integrity error: {str(e)}"
+            )
+        except DatabasePoolExhaustedException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseOperationException(
+                "delete_user", f"Unexpected error: {str(e)}"
+            )
+
+        if deleted_id is None:
+            raise UserNotFoundException(user_id)
+        user_cache.invalidate(user_id)
+
+    @staticmethod
+    async def authenticate_user(
+        db: AsyncSession, email: str, password: str
+    ) -> user_schema.User:
+        """
+        Authenticate a user
+
+        Args:
+            db (AsyncSession): The async database session
+            email (str): The email of the user
+            password (str): The password of the user
+
+        Returns:
+            user_schema.User: The authenticated user
+
+        Raises:
+            UserNotFoundException: If the user with the given email is not found
+            ValueError: If the password is incorrect
+        """
+        user = await AsyncUserService.get_user_by_email(db, email)
+        if user is None:
+            raise UserNotFoundException(f"User with email {email} not found")
+        if not await verify_password_async(password, user.hashed_password):
+            raise ValueError("Incorrect password")
+        return user
@@ -0,0 +1,148 @@
+"""Shared helpers for the benchmark scripts in this package."""
+
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+DEFAULT_SQLITE_PATH = os.path.join(tempfile.gettempdir(), "react_dashboard_bench.db")
+
+
+def configure_environment(database_url: str | None = None, reset: bool = True) -> str:
+    """
+    Point the app settings at the benchmark database before `app` is imported
+
+    Without BENCH_DATABASE_URL (or ``database_url``) a throwaway SQLite file
+    is used as a stand-in for Postgres; its numbers are only comparable with
+    other SQLite runs.
+
+    Args:
+        database_url (str | None): Sync database URL to benchmark against
+        reset (bool): Remove the SQLite stand-in file first
+
+    Returns:
+        str: The database URL in use
+    """
+    url = database_url or os.environ.get("BENCH_DATABASE_URL")
+    if url is None:
+        if reset and os.path.exists(DEFAULT_SQLITE_PATH):
+            os.remove(DEFAULT_SQLITE_PATH)
+        url = f"sqlite:///{DEFAULT_SQLITE_PATH}"
+
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DOMAIN", "localhost")
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    os.environ.setdefault("FRONTEND_URL", "http://localhost:3000")
+    return url
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, max(0, round(quantile * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """
+    Summarize one scenario run
+
+    Args:
+        latencies (list[float]): Per-call latency in seconds
+        errors (int): Number of calls with an unexpected status
+        elapsed (float): Wall-clock duration of the scenario in seconds
+
+    Returns:
+        dict: Throughput and latency percentiles in milliseconds
+    """
+    ordered = sorted(latencies)
+
+    def to_ms(value: float) -> float:
+        return round(value * 1000, 3)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_seconds": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": to_ms(statistics.fmean(ordered)) if ordered else 0.0,
+            "p50": to_ms(percentile(ordered, 0.50)),
+            "p95": to_ms(percentile(ordered, 0.95)),
+            "p99": to_ms(percentile(ordered, 0.99)),
+            "max": to_ms(ordered[-1]) if ordered else 0.0,
+        },
+    }
+
+
+async def run_scenario(
+    call: Callable[[int], Awaitable[bool]], requests: int, concurrency: int
+) -> dict:
+    """
+    Run ``call`` ``requests`` times with at most ``concurrency`` in flight
+
+    Args:
+        call (Callable[[int], Awaitable[bool]]): Performs request number i and
+            returns whether it succeeded
+        requests (int): Total number of calls
+        concurrency (int): Number of concurrent workers
+
+    Returns:
+        dict: The summary produced by summarize()
+    """
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started_at = time.perf_counter()
+            ok = await call(index)
+            latencies.append(time.perf_counter() - started_at)
+            if not ok:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return summarize(latencies, errors, time.perf_counter() - started_at)
+
+
+def run_metadata(**extra) -> dict:
+    """Describe the run so results can be compared across commits"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def write_report(report: dict, output: str | None) -> None:
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(text + "\n")
+    print(text)
@@ -0,0 +1,57 @@
+"""
+Compare two benchmark JSON reports.
+
+Usage::
+
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import json
+
+METRICS = (
+    ("throughput_rps", ("throughput_rps",), True),
+    ("p50_ms", ("latency_ms", "p50"), False),
+    ("p95_ms", ("latency_ms", "p95"), False),
+    ("p99_ms", ("latency_ms", "p99"), False),
+)
+
+
+def _lookup(result: dict, path: tuple[str, ...]) -> float | None:
+    for key in path:
+        if not isinstance(result, dict) or key not in result:
+            return None
+        result = result[key]
+    return result
+
+
+def compare(before: dict, after: dict) -> list[str]:
+    lines = [
+        f"before: {before['meta'].get('commit')}  after: {after['meta'].get('commit')}",
+        f"{'scenario':<28}{'metric':<16}{'before':>12}{'after':>12}{'change':>10}",
+    ]
+    for scenario, result in after["results"].items():
+        baseline = before["results"].get(scenario)
+        if baseline is None:
+            continue
+        for label, path, higher_is_better in METRICS:
+            old, new = _lookup(baseline, path), _lookup(result, path)
+            if old is None or new is None:
+                continue
+            change = ((new - old) / old * 100) if old else 0.0
+            better = change > 0 if higher_is_better else change < 0
+            marker = "+" if better else "-" if change else " "
+            lines.append(
+                f"{scenario:<28}{label:<16}{old:>12.2f}{new:>12.2f}"
+                f"{change:>9.1f}%{marker}"
+            )
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    arguments = parser.parse_args()
+    with open(arguments.before) as before_file, open(arguments.after) as after_file:
+        print("\n".join(compare(json.load(before_file), json.load(after_file))))
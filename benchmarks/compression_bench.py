@@ -0,0 +1,80 @@
+"""
+CPU-vs-bytes tradeoff of response compression for supplier pages.
+
+Compresses supplier list bodies (rendered as the API does, see
+``app.core.responses.dump_json``) with every encoder available to
+``CompressionMiddleware`` at several levels, and reports the compressed size,
+ratio and compression time per page.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.compression_bench --rows 10 100 500 1000 --levels 1 6 9
+"""
+
+import argparse
+import time
+
+from benchmarks.common import (
+    configure_environment,
+    run_metadata,
+    summarize,
+    write_report,
+)
+from benchmarks.serialization_bench import build_rows
+
+
+def main(args: argparse.Namespace) -> dict:
+    configure_environment(reset=False)
+
+    from app.core.compression import available_encoders
+    from app.core.responses import dump_json
+    from app.schemas import supplier as supplier_schema
+
+    results = {}
+    for rows in args.rows:
+        body = dump_json(list[supplier_schema.Supplier], build_rows(rows))
+        for encoding, encoder in available_encoders().items():
+            for level in args.levels:
+                latencies = []
+                started_at = time.perf_counter()
+                for _ in range(args.iterations):
+                    call_started_at = time.perf_counter()
+                    compressor = encoder(level)
+                    data = compressor.compress(body) + compressor.finish()
+                    latencies.append(time.perf_counter() - call_started_at)
+                elapsed = time.perf_counter() - started_at
+
+                result = summarize(latencies, 0, elapsed)
+                result.update(
+                    rows=rows,
+                    encoding=encoding,
+                    level=level,
+                    raw_bytes=len(body),
+                    compressed_bytes=len(data),
+                    ratio=round(len(data) / len(body), 4),
+                )
+                results[f"{rows}_rows_{encoding}_{level}"] = result
+
+    return {
+        "meta": run_metadata(
+            benchmark="compression",
+            rows=args.rows,
+            levels=args.levels,
+            iterations=args.iterations,
+        ),
+        "results": results,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    write_report(main(arguments), arguments.output)
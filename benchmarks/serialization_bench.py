@@ -0,0 +1,104 @@
+"""
+Microbenchmark of response serialization for supplier pages.
+
+Compares FastAPI's response_model path (validate, dump to python objects,
+json.dumps) with the pydantic-core path used by FastJSONRoute
+(``app.core.responses.dump_json``), on transient ORM rows so no database
+round trips are involved.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.serialization_bench --rows 100 --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from benchmarks.common import (
+    configure_environment,
+    run_metadata,
+    summarize,
+    write_report,
+)
+
+
+def build_rows(count: int) -> list:
+    from app.db import db_models
+
+    return [
+        db_models.Supplier(
+            id=uuid.uuid4(),
+            name=f"Supplier {index:05d}",
+            email=f"supplier-{index}@example.com",
+            address=f"{index} Benchmark Street",
+            phone=f"+1-555-{index:07d}",
+            version=1,
+        )
+        for index in range(count)
+    ]
+
+
+async def main(args: argparse.Namespace) -> dict:
+    configure_environment(reset=False)
+
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+
+    from app.core.responses import dump_json
+    from app.schemas import supplier as supplier_schema
+
+    schema = list[supplier_schema.Supplier]
+    field = create_response_field(
+        name="Response", type_=schema, mode="serialization"
+    )
+    rows = build_rows(args.rows)
+
+    async def response_model_path() -> bytes:
+        content = await serialize_response(
+            field=field, response_content=rows, is_coroutine=True
+        )
+        return JSONResponse(content).body
+
+    async def fast_json_path() -> bytes:
+        return dump_json(schema, rows)
+
+    assert await response_model_path() == await fast_json_path()
+
+    results = {}
+    for name, serialize in (
+        ("response_model", response_model_path),
+        ("fast_json", fast_json_path),
+    ):
+        for _ in range(args.warmup):
+            await serialize()
+        latencies = []
+        started_at = time.perf_counter()
+        for _ in range(args.iterations):
+            call_started_at = time.perf_counter()
+            await serialize()
+            latencies.append(time.perf_counter() - call_started_at)
+        results[name] = summarize(latencies, 0, time.perf_counter() - started_at)
+
+    return {
+        "meta": run_metadata(
+            benchmark="serialization", rows=args.rows, iterations=args.iterations
+        ),
+        "results": results,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    write_report(asyncio.run(main(arguments)), arguments.output)
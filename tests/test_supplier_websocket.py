@@ -0,0 +1,48 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from benchmarks.common import configure_environment
+
+configure_environment()
+
+from app.core import security  # noqa: E402
+from app.main import app  # noqa: E402
+
+EMAIL = "ws-origin@example.com"
+
+
+@pytest.fixture
+def client():
+    client = TestClient(app)
+    client.post(
+        "/api/auth/signup",
+        json={"name": "WebSocket", "email": EMAIL, "password": "password"},
+    )
+    token = security.create_access_token({"sub": EMAIL}, 30)
+    client.cookies.set("access_token", f"Bearer {token}")
+    return client
+
+
+def test_foreign_origin_is_refused(client):
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with client.websocket_connect(
+            "/api/suppliers/ws", headers={"origin": "https://evil.example"}
+        ):
+            pass
+    assert refused.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_missing_origin_is_refused(client):
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with client.websocket_connect("/api/suppliers/ws"):
+            pass
+    assert refused.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_allowed_origin_is_accepted(client):
+    with client.websocket_connect(
+        "/api/suppliers/ws", headers={"origin": "http://localhost:3000"}
+    ) as websocket:
+        websocket.close()